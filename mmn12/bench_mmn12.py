@@ -0,0 +1,156 @@
+"""
+Benchmark runner for the mmn12 number functions.
+
+Every benchmark is timed over a sweep of input sizes. The results can be saved
+as a JSON baseline and later runs can be compared against it, failing when a
+benchmark became slower than the allowed tolerance.
+
+Usage:
+    python bench_mmn12.py                          # run and print
+    python bench_mmn12.py --save baseline.json     # run and save a baseline
+    python bench_mmn12.py --compare baseline.json  # run and check for regressions
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+
+from mmn12 import is_prime, compression, sum_square, is_happy
+
+SEED = 20606
+SIZES = [1000, 10000, 100000]
+REPEAT = 5
+
+
+def _prime_input(size):
+    """Random 10- to 12-digit numbers, mostly composite with a few primes."""
+    rng = random.Random(SEED)
+    return [rng.randrange(10 ** 9, 10 ** 12) for _ in range(size)]
+
+
+def _compression_input(size):
+    """A string of size short runs over a small alphabet."""
+    rng = random.Random(SEED)
+    return "".join(rng.choice("aab") * rng.randint(1, 5) for _ in range(size))
+
+
+def _digits_input(size):
+    """Random numbers with up to 12 digits."""
+    rng = random.Random(SEED)
+    return [rng.randrange(1, 10 ** 12) for _ in range(size)]
+
+
+# name -> (input builder, function timed over the input)
+BENCHMARKS = {
+    "is_prime": (_prime_input, lambda nums: [is_prime(n) for n in nums]),
+    "compression": (_compression_input, compression),
+    "sum_square": (_digits_input, lambda nums: [sum_square(n) for n in nums]),
+    "is_happy": (_digits_input, lambda nums: [is_happy(n) for n in nums]),
+}
+
+
+def run_benchmarks(sizes=SIZES, repeat=REPEAT, names=None):
+    """
+    Time every benchmark over every input size.
+
+    Args:
+        sizes (list of int): Input sizes to sweep.
+        repeat (int): Number of timed runs; the fastest one is kept.
+        names (list of str or None): Benchmarks to run, None for all of them.
+
+    Returns:
+        dict: {benchmark name: {str(size): seconds}}.
+    """
+    results = {}
+    for name, (build, func) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        results[name] = {}
+        for size in sizes:
+            data = build(size)
+            times = timeit.repeat(lambda: func(data), number=1, repeat=repeat)
+            results[name][str(size)] = min(times)
+    return results
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Compare benchmark results to a baseline.
+
+    Args:
+        results (dict): Results of run_benchmarks.
+        baseline (dict): Results of an earlier run.
+        tolerance (float): Allowed slowdown, 0.2 means up to 20% slower.
+
+    Returns:
+        list of str: A message for every benchmark that regressed.
+    """
+    regressions = []
+    for name, timings in results.items():
+        for size, seconds in timings.items():
+            old = baseline.get(name, {}).get(size)
+            if old and seconds > old * (1 + tolerance):
+                regressions.append(f"{name}[{size}]: {old:.6f}s -> {seconds:.6f}s "
+                                   f"({seconds / old:.2f}x)")
+    return regressions
+
+
+def print_results(results, baseline=None):
+    """
+    Print the results as a table, with the speedup over the baseline if given.
+
+    Args:
+        results (dict): Results of run_benchmarks.
+        baseline (dict or None): Results of an earlier run.
+    """
+    for name, timings in results.items():
+        for size, seconds in timings.items():
+            line = f"{name:<12} {size:>8} {seconds:12.6f}s"
+            old = (baseline or {}).get(name, {}).get(size)
+            if old:
+                line += f"   baseline {old:.6f}s ({old / seconds:.2f}x faster)"
+            print(line)
+
+
+def main(argv=None):
+    """
+    Run the benchmarks from the command line.
+
+    Args:
+        argv (list of str or None): Command line arguments, None for sys.argv.
+
+    Returns:
+        int: Exit code, 1 if a regression was found and 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the mmn12 functions.")
+    parser.add_argument("--save", help="save the results as a JSON baseline")
+    parser.add_argument("--compare", help="compare the results to a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown (default 0.2)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="input sizes to sweep")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed runs per benchmark")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="benchmarks to run")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.repeat, args.only)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for message in regressions:
+            print("REGRESSION:", message)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+Happy number classifier used by mmn12.is_happy.
+
+Every number below 1000 is classified once, with cycle detection, and kept in
+a table. A larger number only needs sum_square steps until it drops below
+1000, after which the answer is a single lookup.
+"""
+
+from itertools import compress
+
+# Every number below TABLE_SIZE has its answer cached
+TABLE_SIZE = 1000
+# Sum of the digit squares of every 3-digit block 000..999
+BLOCK_SQUARES = [(i // 100) ** 2 + (i // 10 % 10) ** 2 + (i % 10) ** 2 for i in range(1000)]
+
+
+def sum_square(num):
+    """
+    Calculate the sum of the squares of the digits of a number.
+
+    Three digits are handled at a time using BLOCK_SQUARES.
+
+    Args:
+        num (int): A natural number.
+
+    Returns:
+        int: Sum of squares of the digits of num.
+    """
+    result = 0
+    while num > 0:
+        num, block = divmod(num, 1000)
+        result += BLOCK_SQUARES[block]
+    return result
+
+
+def _build_table():
+    """
+    Classify every number below TABLE_SIZE.
+
+    Each chain is followed until it reaches 1, reaches a number that is
+    already classified or repeats a number of its own (a cycle that does not
+    contain 1). Every number on the chain then gets the same answer.
+
+    Returns:
+        bytearray: 1 at every happy index, 0 elsewhere.
+    """
+    table = bytearray(TABLE_SIZE)
+    known = bytearray(TABLE_SIZE)
+    table[1] = known[1] = 1
+
+    for start in range(TABLE_SIZE):
+        path = []
+        on_path = set()
+        n = start
+        while not known[n] and n not in on_path:
+            path.append(n)
+            on_path.add(n)
+            n = sum_square(n)
+        # a repeated number that isn't known yet means a cycle without 1
+        happy = table[n] if known[n] else 0
+        for value in path:
+            table[value] = happy
+            known[value] = 1
+
+    return table
+
+
+_table = _build_table()
+# Masks of happy offsets inside a 1000-number block, keyed by the sum of the
+# squares of the block's higher digits
+_block_masks = {}
+
+
+def is_happy(num):
+    """
+    Determine if a number is a 'happy number'.
+
+    A happy number is one where the repeated process of replacing the number
+    with the sum of squares of its digits eventually reaches 1.
+
+    Args:
+        num (int): The number to check.
+
+    Returns:
+        bool: True if the number is happy, False otherwise.
+    """
+    while num >= TABLE_SIZE:
+        num = sum_square(num)
+    return num >= 0 and _table[num] == 1
+
+
+def _block_mask(high):
+    """
+    Return the happy mask of a 1000-number block.
+
+    Args:
+        high (int): Sum of the squares of the digits above the last three.
+
+    Returns:
+        bytes: 1 at every offset 0..999 whose number is happy, 0 elsewhere.
+    """
+    mask = _block_masks.get(high)
+    if mask is None:
+        mask = bytes(is_happy(high + square) for square in BLOCK_SQUARES)
+        _block_masks[high] = mask
+    return mask
+
+
+def happy_numbers(lo, hi):
+    """
+    Generate all happy numbers n such that lo <= n < hi, in increasing order.
+
+    The range is scanned in blocks of 1000 numbers that share their higher
+    digits, so a whole block is classified by one cached mask.
+
+    Args:
+        lo (int): Inclusive lower bound.
+        hi (int): Exclusive upper bound.
+
+    Yields:
+        int: The next happy number in the range.
+    """
+    lo = max(lo, 1)
+    for base in range(lo - lo % 1000, hi, 1000):
+        mask = _block_mask(sum_square(base // 1000))
+        start = max(lo, base) - base
+        end = min(hi, base + 1000) - base
+        yield from compress(range(base + start, base + end), mask[start:end])
+
+
+def _count_below(n):
+    """
+    Count the happy numbers in the range 0 <= x < n.
+
+    The count is done digit by digit: for every prefix of n followed by a
+    smaller digit, the remaining digits are free, and the number of ways to
+    fill them with every possible sum of squares is known in advance.
+
+    Args:
+        n (int): Exclusive upper bound.
+
+    Returns:
+        int: The number of happy numbers below n.
+    """
+    if n <= 1:
+        return 0
+
+    digits = [int(d) for d in str(n)]
+    # ways[k][s] = number of k-digit strings whose digit squares sum to s
+    ways = [[1]]
+    for k in range(1, len(digits)):
+        prev = ways[-1]
+        cur = [0] * (81 * k + 1)
+        for s, count in enumerate(prev):
+            if count:
+                for d in range(10):
+                    cur[s + d * d] += count
+        ways.append(cur)
+
+    happy = bytes(is_happy(s) for s in range(81 * len(digits) + 1))
+    total = 0
+    prefix = 0
+    for i, digit in enumerate(digits):
+        free = ways[len(digits) - i - 1]
+        for d in range(digit):
+            base = prefix + d * d
+            total += sum(count for s, count in enumerate(free) if happy[base + s])
+        prefix += digit * digit
+
+    return total
+
+
+def count_happy(lo, hi):
+    """
+    Count the happy numbers n such that lo <= n < hi.
+
+    Args:
+        lo (int): Inclusive lower bound.
+        hi (int): Exclusive upper bound.
+
+    Returns:
+        int: The number of happy numbers in the range.
+    """
+    if hi <= lo:
+        return 0
+    return _count_below(hi) - _count_below(max(lo, 0))
@@ -0,0 +1,81 @@
+"""
+NumPy versions of sum_square and is_happy that work on whole arrays.
+"""
+
+import numpy as np
+
+import happy
+
+_DIGIT_SQUARES = np.arange(10, dtype=np.int64) ** 2
+# Lookup tables of digit-square sums, keyed by the number of digits they cover
+_tables = {1: _DIGIT_SQUARES}
+_HAPPY = np.array([happy.is_happy(n) for n in range(happy.TABLE_SIZE)], dtype=bool)
+
+
+def _square_table(digits):
+    """
+    Return the digit-square sum of every number with the given number of digits.
+
+    Args:
+        digits (int): Number of digits covered by the table.
+
+    Returns:
+        numpy.ndarray: Array of size 10 ** digits, entry i is sum_square(i).
+    """
+    table = _tables.get(digits)
+    if table is None:
+        table = np.add.outer(_square_table(digits - 1), _DIGIT_SQUARES).ravel()
+        _tables[digits] = table
+    return table
+
+
+def sum_square_array(arr, digits_per_step=3):
+    """
+    Calculate the sum of the squares of the digits of every number in an array.
+
+    Every step peels digits_per_step digits off all the numbers at once and
+    looks their digit-square sum up in a precomputed table.
+
+    Args:
+        arr (array-like of int): Natural numbers, converted once to int64.
+        digits_per_step (int): Digits handled per step (table of 10 ** digits_per_step entries).
+
+    Returns:
+        numpy.ndarray: int64 array of the same shape with the sums.
+
+    Raises:
+        ValueError: If arr contains negative numbers or digits_per_step is not in 1..6.
+    """
+    if not 1 <= digits_per_step <= 6:
+        raise ValueError("digits_per_step must be between 1 and 6!")
+
+    nums = np.array(arr, dtype=np.int64)
+    if (nums < 0).any():
+        raise ValueError("All values must be natural numbers!")
+
+    table = _square_table(digits_per_step)
+    base = 10 ** digits_per_step
+    result = np.zeros(nums.shape, dtype=np.int64)
+    while nums.any():
+        nums, block = np.divmod(nums, base)
+        result += table[block]
+    return result
+
+
+def is_happy_array(arr):
+    """
+    Determine for every number in an array whether it is a 'happy number'.
+
+    Args:
+        arr (array-like of int): Natural numbers, converted once to int64.
+
+    Returns:
+        numpy.ndarray: bool array of the same shape, True at every happy number.
+    """
+    # negative numbers are never happy, just like 0
+    nums = np.maximum(np.asarray(arr, dtype=np.int64), 0)
+    # numbers already below the table size are looked up directly; the rest
+    # need one step (two for 19-digit numbers) to get there
+    nums = np.where(nums < happy.TABLE_SIZE, nums, sum_square_array(nums))
+    nums = np.where(nums < happy.TABLE_SIZE, nums, sum_square_array(nums))
+    return _HAPPY[nums]
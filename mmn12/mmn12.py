@@ -3,20 +3,39 @@ by @Elad_Benjo April 2025
 The Open University of Israel
 """
 
+import happy
+import primes
+import rle
+
+
 def is_prime(n):
     """
     Check if a number is prime.
 
+    The check is delegated to the primes module, which uses a cached sieve for
+    small numbers and a deterministic Miller-Rabin test for large ones.
+
     Args:
         n (int): A natural number greater than 1.
 
     Returns:
         bool: True if n is a prime number, False otherwise.
     """
-    for i in range(2, n):
-        if n % i == 0:
-            return False
-    return True
+    return primes.is_prime(n)
+
+
+def read_numbers():
+    """
+    Read numbers from user input until a number less than 1 is entered.
+
+    Yields:
+        int: The next number entered by the user, including the stop value.
+    """
+    while True:
+        n = int(input("Enter a number (less than 1 to stop): "))
+        yield n
+        if n < 1:
+            break
 
 
 def max_prime():
@@ -28,15 +47,61 @@ def max_prime():
     Returns:
         int: The largest prime number entered, or 1 if none were prime.
     """
-    primes = []
-    while True:
-        n = int(input("Enter a number (less than 1 to stop): "))
+    return max_prime_stream(read_numbers(), chunk_size=1)
+
+
+def max_prime_stream(numbers, chunk_size=4096):
+    """
+    Return the maximum prime number from any stream of numbers.
+
+    The stream can be any iterable of ints or numeric strings, such as a list,
+    an open file or sys.stdin. Blank lines are skipped and, like max_prime,
+    reading stops at the first number less than 1. Numbers are classified in
+    chunks with primes.is_prime_many, and only numbers larger than the running
+    maximum are checked, so memory use is O(chunk_size).
+
+    Args:
+        numbers (iterable of int or str): The numbers to scan.
+        chunk_size (int): How many numbers to classify in each batch.
+
+    Returns:
+        int: The largest prime number in the stream, or 1 if none were prime.
+    """
+    best = 1
+    chunk = []
+
+    for n in numbers:
+        if isinstance(n, (str, bytes)):
+            if not n.strip():
+                continue
+            n = int(n)
         if n < 1:
             break
-        if is_prime(n):
-            primes.append(n)
+        if n > best:
+            chunk.append(n)
+        if len(chunk) >= chunk_size:
+            best = _max_prime_in(chunk, best)
+            chunk = []
+
+    return _max_prime_in(chunk, best)
 
-    return max(primes) if primes else 1
+
+def _max_prime_in(chunk, best):
+    """
+    Return the maximum between best and the largest prime in chunk.
+
+    Args:
+        chunk (list of int): Numbers to classify.
+        best (int): The current running maximum.
+
+    Returns:
+        int: The new running maximum.
+    """
+    candidates = [n for n in chunk if n > best]
+    for n, prime in zip(candidates, primes.is_prime_many(candidates)):
+        if prime and n > best:
+            best = n
+    return best
 
 
 def compression(s):
@@ -45,27 +110,16 @@ def compression(s):
 
     For each sequence of repeated characters, store the character followed by the count.
     If a character appears only once, it is stored without a count.
+    The encoding is done in linear time by the rle module; digits in the input are
+    not escaped, so use rle.compress when the result must be decompressed.
 
     Args:
-        s (str): The original string to compress.
+        s (str or bytes-like): The original string to compress.
 
     Returns:
-        str: The compressed string.
+        str or bytes: The compressed string.
     """
-    result = ""
-    count = 1
-
-    for i in range(len(s)):
-        # Check if next character is the same
-        if (i + 1) < len(s) and s[i] == s[i + 1]:
-            count += 1
-        else:
-            result += s[i]
-            if count > 1:
-                result += str(count)
-            count = 1  # Reset for the next character
-
-    return result
+    return rle.compress(s, escape=False)
 
 
 def sum_square(num):
@@ -92,7 +146,8 @@ def is_happy(num):
 
     A happy number is one where the repeated process of replacing the number
     with the sum of squares of its digits eventually reaches 1.
-    The process stops after 10 steps. If 1 is not reached, the number is not happy.
+    The process is checked by the happy module, which detects the cycle the
+    number falls into and caches the answer of every number below 1000.
 
     Args:
         num (int): The number to check.
@@ -100,13 +155,7 @@ def is_happy(num):
     Returns:
         bool: True if the number is happy, False otherwise.
     """
-    count = 0
-    while num != 1:
-        num = sum_square(num)
-        count += 1
-        if count == 10:
-            return False
-    return True
+    return happy.is_happy(num)
 
 
 def count_happy_numbers():
@@ -116,8 +165,4 @@ def count_happy_numbers():
     Returns:
         int: The number of happy numbers between 1 and 100.
     """
-    happy_numbers_count = 0
-    for i in range(1, 101):
-        if is_happy(i):
-            happy_numbers_count += 1
-    return happy_numbers_count
+    return happy.count_happy(1, 101)
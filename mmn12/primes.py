@@ -0,0 +1,166 @@
+"""
+Prime number engine used by mmn12.is_prime.
+
+Small numbers are answered from one cached Sieve of Eratosthenes, ranges are
+scanned with a segmented sieve and everything above the cached sieve goes
+through a deterministic Miller-Rabin test.
+"""
+
+from itertools import compress
+from math import isqrt
+
+# Largest value the cached sieve is allowed to grow to (one byte per number)
+SIEVE_MAX = 1 << 24
+# Size of a single segment when sieving a range
+SEGMENT_SIZE = 1 << 18
+
+# Miller-Rabin bases that are deterministic for every n < 3.3 * 10**24,
+# which covers all 64-bit integers
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+_sieve = bytearray(b"\x00\x00\x01")
+_base_primes = [2]
+
+
+def _ensure_sieve(limit):
+    """
+    Grow the cached sieve so it covers all numbers below limit.
+
+    Args:
+        limit (int): Exclusive upper bound the sieve must cover.
+    """
+    global _sieve, _base_primes
+    limit = min(limit, SIEVE_MAX)
+    if limit <= len(_sieve):
+        return
+
+    # Grow geometrically so repeated calls don't rebuild the sieve every time
+    limit = min(max(limit, 2 * len(_sieve)), SIEVE_MAX)
+    sieve = bytearray(b"\x01") * limit
+    sieve[0] = sieve[1] = 0
+    for i in range(2, isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+
+    _sieve = sieve
+    _base_primes = list(compress(range(limit), sieve))
+
+
+def _miller_rabin(n):
+    """
+    Deterministic Miller-Rabin primality test for odd n > 37 with no factor in MR_BASES.
+
+    Args:
+        n (int): Odd number to test.
+
+    Returns:
+        bool: True if n is a prime number, False otherwise.
+    """
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n):
+    """
+    Check if a number is prime.
+
+    Numbers covered by the cached sieve are a single lookup, larger numbers
+    are filtered by a few small primes and then tested with Miller-Rabin.
+
+    Args:
+        n (int): A natural number.
+
+    Returns:
+        bool: True if n is a prime number, False otherwise.
+    """
+    if n < len(_sieve):
+        return n >= 0 and _sieve[n] == 1
+
+    for p in MR_BASES:
+        if n % p == 0:
+            return n == p
+    return _miller_rabin(n)
+
+
+def primes_in_range(lo, hi):
+    """
+    Generate all primes p such that lo <= p < hi, in increasing order.
+
+    The range is scanned with a segmented sieve, so memory use stays at
+    SEGMENT_SIZE bytes regardless of the size of the range. The base primes
+    stop at SIEVE_MAX, so above SIEVE_MAX ** 2 the numbers left by the sieve
+    are confirmed with is_prime.
+
+    Args:
+        lo (int): Inclusive lower bound.
+        hi (int): Exclusive upper bound.
+
+    Yields:
+        int: The next prime in the range.
+    """
+    lo = max(lo, 2)
+    if hi <= lo:
+        return
+
+    _ensure_sieve(isqrt(hi - 1) + 1)
+    if hi <= len(_sieve):
+        yield from compress(range(lo, hi), _sieve[lo:hi])
+        return
+
+    for seg_lo in range(lo, hi, SEGMENT_SIZE):
+        seg_hi = min(seg_lo + SEGMENT_SIZE, hi)
+        segment = bytearray(b"\x01") * (seg_hi - seg_lo)
+        root = isqrt(seg_hi - 1)
+
+        for p in _base_primes:
+            if p > root:
+                break
+            # first multiple of p inside the segment, never below p * p
+            start = max(p * p, (seg_lo + p - 1) // p * p)
+            if start < seg_hi:
+                segment[start - seg_lo::p] = bytes(len(range(start, seg_hi, p)))
+
+        survivors = compress(range(seg_lo, seg_hi), segment)
+        if root < len(_sieve):
+            yield from survivors
+        else:
+            # not every factor up to root was sieved out
+            yield from filter(is_prime, survivors)
+
+
+def is_prime_many(numbers):
+    """
+    Check primality for a batch of numbers.
+
+    The cached sieve is grown once to cover the batch (up to SIEVE_MAX), so
+    every number below that bound is a single lookup.
+
+    Args:
+        numbers (iterable of int): The numbers to check.
+
+    Returns:
+        list of bool: is_prime(n) for every n in numbers, in the same order.
+    """
+    numbers = list(numbers)
+    if not numbers:
+        return []
+
+    _ensure_sieve(max(numbers) + 1)
+    sieve = _sieve
+    size = len(sieve)
+    return [sieve[n] == 1 if 0 <= n < size else is_prime(n) for n in numbers]
@@ -0,0 +1,356 @@
+"""
+Run-length encoding codec used by mmn12.compression.
+
+The format is the one from the assignment: every run is written as its
+character followed by the run length, and the length is left out for runs of
+a single character ("aabccc" -> "a2bc3").
+
+Because counts are written as decimal digits, digits (and the backslash used
+to escape them) inside the data are written with a leading backslash, so
+"a11" is encoded as "a\\12". Data without digits or backslashes is encoded
+exactly like the assignment format. Both str and bytes-like input (bytes,
+bytearray, memoryview) are supported; bytes-like input is scanned in place
+without being copied. compress_file and decompress_file stream whole files
+through the codec in fixed-size chunks.
+"""
+
+import mmap
+import os
+import re
+
+_RUN_STR = re.compile(r"(.)\1*", re.S)
+_RUN_BYTES = re.compile(rb"(.)\1*", re.S)
+_TOKEN_STR = re.compile(r"\\(.)([0-9]*)|([^\\0-9])([0-9]*)", re.S)
+_TOKEN_BYTES = re.compile(rb"\\(.)([0-9]*)|([^\\0-9])([0-9]*)", re.S)
+
+_ESCAPED_STR = frozenset("0123456789\\")
+_ESCAPED_BYTES = frozenset(b"0123456789\\")
+
+# Size of the chunks files are read and written in
+CHUNK_SIZE = 1 << 20
+
+
+def _encode_run_str(parts, symbol, count, escape):
+    """
+    Append a single encoded str run to a list of parts.
+
+    Args:
+        parts (list of str): Output parts.
+        symbol (str): The repeated character.
+        count (int): Length of the run.
+        escape (bool): Whether digits and backslashes are escaped.
+    """
+    if escape and symbol in _ESCAPED_STR:
+        parts.append("\\")
+    parts.append(symbol)
+    if count > 1:
+        parts.append(str(count))
+
+
+def _encode_run_bytes(out, symbol, count, escape):
+    """
+    Append a single encoded bytes run to a bytearray.
+
+    Args:
+        out (bytearray): Output buffer.
+        symbol (int): The repeated byte value.
+        count (int): Length of the run.
+        escape (bool): Whether digits and backslashes are escaped.
+    """
+    if escape and symbol in _ESCAPED_BYTES:
+        out.append(0x5C)
+    out.append(symbol)
+    if count > 1:
+        out += b"%d" % count
+
+
+def compress_into(data, out, escape=True):
+    """
+    Compress bytes-like data and append the result to an existing buffer.
+
+    Args:
+        data (bytes-like): The data to compress.
+        out (bytearray): Buffer the encoded runs are appended to.
+        escape (bool): Escape digits and backslashes so the output can be decompressed.
+
+    Returns:
+        int: Number of bytes appended to out.
+    """
+    start = len(out)
+    for m in _RUN_BYTES.finditer(data):
+        _encode_run_bytes(out, data[m.start()], m.end() - m.start(), escape)
+    return len(out) - start
+
+
+def compress(data, escape=True):
+    """
+    Compress a string or bytes-like object using run-length encoding.
+
+    The encoder makes a single pass over the data and collects the output in a
+    list (for str) or a bytearray (for bytes), so it runs in linear time.
+
+    Args:
+        data (str or bytes-like): The data to compress.
+        escape (bool): Escape digits and backslashes so the output can be decompressed.
+
+    Returns:
+        str or bytes: The compressed data, of the same kind as the input.
+    """
+    if isinstance(data, str):
+        parts = []
+        for m in _RUN_STR.finditer(data):
+            _encode_run_str(parts, m.group(1), m.end() - m.start(), escape)
+        return "".join(parts)
+
+    out = bytearray()
+    compress_into(data, out, escape)
+    return bytes(out)
+
+
+def decompress(data):
+    """
+    Decompress data produced by compress.
+
+    Args:
+        data (str or bytes-like): The compressed data.
+
+    Returns:
+        str or bytes: The original data, of the same kind as the input.
+
+    Raises:
+        ValueError: If data is not a valid run-length encoding.
+    """
+    text = isinstance(data, str)
+    token = _TOKEN_STR if text else _TOKEN_BYTES
+    out = [] if text else bytearray()
+    pos = 0
+
+    for m in token.finditer(data):
+        if m.start() != pos:
+            break
+        symbol = m.group(1) if m.group(1) is not None else m.group(3)
+        digits = m.group(2) if m.group(1) is not None else m.group(4)
+        count = int(digits) if digits else 1
+        if text:
+            out.append(symbol * count)
+        else:
+            out += symbol * count
+        pos = m.end()
+
+    if pos != len(data):
+        raise ValueError("Invalid run-length encoding at position " + str(pos))
+
+    return "".join(out) if text else bytes(out)
+
+
+class RLEEncoder:
+    """
+    Incremental run-length encoder that can be fed the data in chunks.
+
+    The last run of every chunk is held back, since the next chunk may
+    continue it, and is written by the next feed or by flush.
+    """
+
+    def __init__(self, escape=True, binary=None):
+        """
+        Initialize an encoder.
+
+        Args:
+            escape (bool): Escape digits and backslashes so the output can be decompressed.
+            binary (bool or None): True for bytes input, False for str input, None to
+                take the kind of the first chunk.
+        """
+        self._escape = escape
+        self._text = None if binary is None else not binary
+        self._symbol = None
+        self._count = 0
+
+    def _encode_pending(self, out):
+        """
+        Write the pending run, if any, to out.
+
+        Args:
+            out (list of str or bytearray): Output for the current chunk.
+        """
+        if self._count:
+            if self._text:
+                _encode_run_str(out, self._symbol, self._count, self._escape)
+            else:
+                _encode_run_bytes(out, self._symbol, self._count, self._escape)
+        self._symbol = None
+        self._count = 0
+
+    def feed(self, chunk):
+        """
+        Encode the next chunk of data.
+
+        Args:
+            chunk (str or bytes-like): The next part of the data.
+
+        Returns:
+            str or bytes: Encoded output for every run completed so far.
+
+        Raises:
+            TypeError: If chunk is not of the same kind as the previous chunks.
+        """
+        text = isinstance(chunk, str)
+        if self._text is None:
+            self._text = text
+        elif self._text != text:
+            raise TypeError("Can't mix str and bytes chunks in one encoder!")
+
+        out = [] if text else bytearray()
+        run = _RUN_STR if text else _RUN_BYTES
+
+        for m in run.finditer(chunk):
+            symbol = m.group(1) if text else chunk[m.start()]
+            count = m.end() - m.start()
+            if symbol == self._symbol:
+                # this run continues the run left over from the previous chunk
+                self._count += count
+            else:
+                self._encode_pending(out)
+                self._symbol = symbol
+                self._count = count
+
+        return "".join(out) if text else bytes(out)
+
+    def flush(self):
+        """
+        Finish encoding and write the pending run.
+
+        Returns:
+            str or bytes: Encoded output of the last run, str if the kind of input
+            is still unknown (no binary given and no chunk fed).
+        """
+        text = self._text is not False
+        out = [] if text else bytearray()
+        self._encode_pending(out)
+        return "".join(out) if text else bytes(out)
+
+
+def _iter_chunks(f, chunk_size):
+    """
+    Memory-map an open file and yield it in fixed-size chunks.
+
+    Every chunk is a memoryview over the mapping, so no data is copied, and it
+    is released as soon as the consumer asks for the next one.
+
+    Args:
+        f (file): A file opened for binary reading.
+        chunk_size (int): Size of every chunk (the last one may be shorter).
+
+    Yields:
+        memoryview: The next chunk of the file.
+    """
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        return  # empty files can't be memory-mapped
+
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            for start in range(0, size, chunk_size):
+                with view[start:start + chunk_size] as chunk:
+                    yield chunk
+
+
+def compress_file(src, dst, chunk_size=CHUNK_SIZE, escape=True):
+    """
+    Compress the file src into the file dst.
+
+    The input is memory-mapped and encoded chunk by chunk with an RLEEncoder,
+    so a run that crosses a chunk boundary is still written as a single run and
+    files larger than the available memory can be compressed.
+
+    Args:
+        src (str or path-like): Path of the file to compress.
+        dst (str or path-like): Path of the compressed file to write.
+        chunk_size (int): Number of input bytes encoded at a time.
+        escape (bool): Escape digits and backslashes so the output can be decompressed.
+
+    Returns:
+        int: Number of bytes written to dst.
+    """
+    encoder = RLEEncoder(escape, binary=True)
+    written = 0
+
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        for chunk in _iter_chunks(fin, chunk_size):
+            written += fout.write(encoder.feed(chunk))
+        written += fout.write(encoder.flush())
+
+    return written
+
+
+def _decode_tokens(data, fout, final, piece_size):
+    """
+    Decode the complete tokens at the start of data and write them to fout.
+
+    Unless final is set, the last token is held back because its count may
+    continue in the next chunk.
+
+    Args:
+        data (bytes): Encoded data, starting at a token boundary.
+        fout (file): A file opened for binary writing.
+        final (bool): Whether data is the end of the encoded stream.
+        piece_size (int): Maximum size of a single write when expanding long runs.
+
+    Returns:
+        tuple: (number of bytes consumed from data, number of bytes written).
+
+    Raises:
+        ValueError: If data is not a valid run-length encoding.
+    """
+    pos = 0
+    written = 0
+
+    for m in _TOKEN_BYTES.finditer(data):
+        if m.start() != pos:
+            raise ValueError("Invalid run-length encoding at position " + str(pos))
+        if m.end() == len(data) and not final:
+            return pos, written
+
+        symbol = m.group(1) if m.group(1) is not None else m.group(3)
+        digits = m.group(2) if m.group(1) is not None else m.group(4)
+        count = int(digits) if digits else 1
+        # expand long runs in pieces so a single run never has to fit in memory
+        while count > 0:
+            size = min(count, piece_size)
+            written += fout.write(symbol * size)
+            count -= size
+        pos = m.end()
+
+    tail = data[pos:]
+    if tail and (final or tail != b"\\"):
+        raise ValueError("Invalid run-length encoding at position " + str(pos))
+    return pos, written
+
+
+def decompress_file(src, dst, chunk_size=CHUNK_SIZE):
+    """
+    Decompress the file src, produced by compress_file, into the file dst.
+
+    Args:
+        src (str or path-like): Path of the compressed file.
+        dst (str or path-like): Path of the decompressed file to write.
+        chunk_size (int): Number of input bytes decoded at a time.
+
+    Returns:
+        int: Number of bytes written to dst.
+
+    Raises:
+        ValueError: If src is not a valid run-length encoding.
+    """
+    pending = b""
+    written = 0
+
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        for chunk in _iter_chunks(fin, chunk_size):
+            data = pending + chunk
+            used, count = _decode_tokens(data, fout, False, chunk_size)
+            pending = data[used:]
+            written += count
+        used, count = _decode_tokens(pending, fout, True, chunk_size)
+        written += count
+
+    return written
@@ -0,0 +1,213 @@
+"""
+Block container for the rle codec.
+
+The input is split into fixed-size blocks that are encoded independently, so
+they can be compressed and decompressed across a process pool and a single
+block can be decoded without reading the rest of the file.
+
+File layout (all integers little-endian):
+
+    header   MAGIC, version (1 byte), block size (4 bytes)
+    blocks   the encoded blocks, one after the other
+    index    for every block: offset, encoded length, raw length (8 bytes each)
+    footer   index offset (8 bytes), block count (4 bytes), MAGIC
+"""
+
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+import rle
+
+MAGIC = b"RLEB"
+VERSION = 1
+# Number of raw bytes in every block (the last one may be shorter)
+BLOCK_SIZE = 1 << 22
+
+_HEADER = struct.Struct("<4sBI")
+_ENTRY = struct.Struct("<QQQ")
+_FOOTER = struct.Struct("<QI4s")
+
+
+def _encode_block(path, start, end):
+    """
+    Encode the bytes start:end of the file at path.
+
+    Workers open and map the file themselves, so the raw data is never sent
+    between processes.
+
+    Args:
+        path (str): Path of the file to compress.
+        start (int): Offset of the first byte of the block.
+        end (int): Offset one past the last byte of the block.
+
+    Returns:
+        bytes: The encoded block.
+    """
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                with view[start:end] as block:
+                    return rle.compress(block)
+
+
+def _decode_block(path, offset, length):
+    """
+    Decode a single encoded block of the container at path.
+
+    Args:
+        path (str): Path of the container file.
+        offset (int): Offset of the encoded block.
+        length (int): Length of the encoded block.
+
+    Returns:
+        bytes: The raw block.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return rle.decompress(f.read(length))
+
+
+def _map(func, workers, *args):
+    """
+    Apply func over the argument lists, in a process pool when workers > 1.
+
+    Args:
+        func (callable): Module-level function to apply.
+        workers (int or None): Number of processes, None for one per CPU.
+        *args (list): Argument lists, as for the builtin map.
+
+    Yields:
+        The results of func, in order.
+    """
+    if workers == 1:
+        yield from map(func, *args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(func, *args)
+
+
+def read_index(f):
+    """
+    Read the block size and the block index of an open container file.
+
+    Args:
+        f (file): A container file opened for binary reading.
+
+    Returns:
+        tuple: (block size, list of (offset, encoded length, raw length) per block).
+
+    Raises:
+        ValueError: If f is not a valid container file.
+    """
+    header = f.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValueError("File is too short to be an RLE block container")
+    magic, version, block_size = _HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not an RLE block container (version " + str(VERSION) + ")")
+
+    size = f.seek(0, os.SEEK_END)
+    if size < _HEADER.size + _FOOTER.size:
+        raise ValueError("RLE block container is truncated")
+    f.seek(size - _FOOTER.size)
+    index_offset, count, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+    if magic != MAGIC:
+        raise ValueError("RLE block container is truncated")
+
+    f.seek(index_offset)
+    raw = f.read(count * _ENTRY.size)
+    if len(raw) != count * _ENTRY.size:
+        raise ValueError("RLE block container index is truncated")
+    return block_size, list(_ENTRY.iter_unpack(raw))
+
+
+def read_block(path, i):
+    """
+    Decode a single block of a container file without reading the others.
+
+    Args:
+        path (str or path-like): Path of the container file.
+        i (int): Index of the block.
+
+    Returns:
+        bytes: The raw data of block i.
+
+    Raises:
+        IndexError: If the container has no block i.
+    """
+    with open(path, "rb") as f:
+        index = read_index(f)[1]
+        if i < 0 or i >= len(index):
+            raise IndexError("The block " + str(i) + " is out of the container boundaries")
+        offset, length = index[i][:2]
+    return _decode_block(path, offset, length)
+
+
+def compress_file_blocks(src, dst, block_size=BLOCK_SIZE, workers=None):
+    """
+    Compress the file src into a block container at dst.
+
+    Args:
+        src (str or path-like): Path of the file to compress.
+        dst (str or path-like): Path of the container file to write.
+        block_size (int): Number of raw bytes in every block.
+        workers (int or None): Number of processes, None for one per CPU.
+
+    Returns:
+        int: Number of blocks written.
+    """
+    src = os.fspath(src)
+    size = os.path.getsize(src)
+    starts = list(range(0, size, block_size))
+    ends = [min(start + block_size, size) for start in starts]
+
+    index = []
+    with open(dst, "wb") as fout:
+        offset = fout.write(_HEADER.pack(MAGIC, VERSION, block_size))
+        blocks = _map(_encode_block, workers, [src] * len(starts), starts, ends)
+        for start, end, block in zip(starts, ends, blocks):
+            length = fout.write(block)
+            index.append((offset, length, end - start))
+            offset += length
+
+        for entry in index:
+            fout.write(_ENTRY.pack(*entry))
+        fout.write(_FOOTER.pack(offset, len(index), MAGIC))
+
+    return len(index)
+
+
+def decompress_file_blocks(src, dst, workers=None):
+    """
+    Decompress the block container src into the file dst.
+
+    Args:
+        src (str or path-like): Path of the container file.
+        dst (str or path-like): Path of the decompressed file to write.
+        workers (int or None): Number of processes, None for one per CPU.
+
+    Returns:
+        int: Number of bytes written to dst.
+
+    Raises:
+        ValueError: If src is not a valid container or a block has the wrong size.
+    """
+    src = os.fspath(src)
+    with open(src, "rb") as f:
+        index = read_index(f)[1]
+
+    offsets = [entry[0] for entry in index]
+    lengths = [entry[1] for entry in index]
+    written = 0
+
+    with open(dst, "wb") as fout:
+        blocks = _map(_decode_block, workers, [src] * len(index), offsets, lengths)
+        for entry, block in zip(index, blocks):
+            if len(block) != entry[2]:
+                raise ValueError("Block at offset " + str(entry[0]) + " has the wrong size")
+            written += fout.write(block)
+
+    return written
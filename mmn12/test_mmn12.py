@@ -0,0 +1,247 @@
+"""
+Test module for the mmn12 number functions and their helper modules.
+"""
+
+import io
+
+import pytest
+
+from mmn12 import is_prime, max_prime_stream, compression, sum_square, is_happy, count_happy_numbers
+from primes import primes_in_range, is_prime_many, SEGMENT_SIZE
+from rle import compress, decompress, compress_into, RLEEncoder, compress_file, decompress_file
+from rle_blocks import compress_file_blocks, decompress_file_blocks, read_block
+from happy import happy_numbers, count_happy
+import bench_mmn12
+
+
+def _naive_is_prime(n):
+    if n < 2:
+        return False
+    for i in range(2, n):
+        if n % i == 0:
+            return False
+    return True
+
+
+def _naive_is_happy(n):
+    seen = set()
+    while n != 1 and n not in seen:
+        seen.add(n)
+        n = sum_square(n)
+    return n == 1
+
+
+def test_is_prime_small():
+    for n in range(-5, 2000):
+        assert is_prime(n) == _naive_is_prime(n), f"is_prime({n}) is wrong"
+
+
+def test_is_prime_large():
+    assert is_prime(1000000007), "10^9+7 is prime"
+    assert not is_prime(1000000007 * 998244353), "Product of two primes is not prime"
+    assert is_prime(2 ** 61 - 1), "Mersenne prime 2^61-1"
+    assert not is_prime(3215031751), "Strong pseudoprime to bases 2, 3, 5, 7"
+    assert is_prime(18446744073709551557), "Largest 64-bit prime"
+
+
+def test_primes_in_range():
+    assert list(primes_in_range(0, 30)) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert list(primes_in_range(30, 30)) == []
+    lo = 10 ** 9
+    hi = lo + SEGMENT_SIZE + 500
+    found = list(primes_in_range(lo, hi))
+    assert found == [n for n in range(lo, hi) if is_prime(n)], "Segmented sieve must match is_prime"
+    # above SIEVE_MAX ** 2 the base primes don't reach the square root
+    square = 16777259 ** 2
+    found = list(primes_in_range(square - 50, square + 50))
+    assert square not in found, "Square of a prime above SIEVE_MAX is not prime"
+    assert found == [n for n in range(square - 50, square + 50) if is_prime(n)]
+
+
+def test_is_prime_many():
+    numbers = [0, 1, 2, 97, 100, 7919, 1000000007, -3]
+    assert is_prime_many(numbers) == [is_prime(n) for n in numbers]
+    assert is_prime_many([]) == []
+
+
+def test_max_prime_stream():
+    assert max_prime_stream([4, 7, 12, 13, 9]) == 13
+    assert max_prime_stream([4, 6, 8]) == 1, "No primes should return 1"
+    assert max_prime_stream([5, 0, 11]) == 5, "Reading stops at the first number below 1"
+    assert max_prime_stream(iter(range(1, 10000)), chunk_size=7) == 9973
+
+
+def test_max_prime_stream_file():
+    dump = io.StringIO("10\n17\n\n23\n  8 \n")
+    assert max_prime_stream(dump) == 23
+
+
+def test_compression():
+    assert compression("aabccceeeeedab") == "a2bc3e5dab"
+    assert compression("abcde") == "abcde"
+    assert compression("x3y3z3") == "x3y3z3", "compression keeps the assignment format"
+    assert compression("") == ""
+
+
+def test_rle_round_trip():
+    samples = ["", "a", "aaaa", "a11b\\\\22", "x" * 1000 + "y", "\u05e9\u05e9\u05dc"]
+    for sample in samples:
+        assert decompress(compress(sample)) == sample, f"Round trip failed for {sample!r}"
+        raw = sample.encode()
+        assert decompress(compress(raw)) == raw
+        assert decompress(compress(memoryview(raw))) == raw
+    assert compress(b"aab11") == b"a2b\\12"
+
+
+def test_rle_compress_into():
+    out = bytearray(b"head:")
+    written = compress_into(memoryview(b"zzzq"), out)
+    assert out == b"head:z3q" and written == 3
+
+
+def test_rle_decompress_invalid():
+    for bad in ["3a", "a\\", b"12"]:
+        try:
+            decompress(bad)
+        except ValueError:
+            continue
+        assert False, f"decompress({bad!r}) should raise ValueError"
+
+
+def test_rle_encoder_chunks():
+    data = b"aaab" + b"b" * 10 + b"1cc" + b"c"
+    expected = compress(data)
+    for size in (1, 2, 3, 5, len(data)):
+        encoder = RLEEncoder()
+        parts = [encoder.feed(data[i:i + size]) for i in range(0, len(data), size)]
+        assert b"".join(parts) + encoder.flush() == expected, f"Chunk size {size} failed"
+    assert RLEEncoder(binary=True).flush() == b"", "A binary encoder with no chunks gives bytes"
+    assert RLEEncoder(binary=False).flush() == ""
+    with pytest.raises(TypeError):
+        RLEEncoder(binary=True).feed("abc")
+
+
+def test_rle_files(tmp_path):
+    data = b"ab" * 50 + b"c" * 700 + b"12\\\\" + b"d" * 3000 + b"\n"
+    src = tmp_path / "data.bin"
+    packed = tmp_path / "data.rle"
+    unpacked = tmp_path / "data.out"
+    src.write_bytes(data)
+    for chunk_size in (1, 3, 7, 4096):
+        compress_file(src, packed, chunk_size=chunk_size)
+        assert packed.read_bytes() == compress(data), f"Chunk size {chunk_size} changed the encoding"
+        assert decompress_file(packed, unpacked, chunk_size=chunk_size) == len(data)
+        assert unpacked.read_bytes() == data
+
+
+def test_rle_files_empty(tmp_path):
+    src = tmp_path / "empty.bin"
+    src.write_bytes(b"")
+    assert compress_file(src, tmp_path / "empty.rle") == 0
+    assert decompress_file(tmp_path / "empty.rle", tmp_path / "empty.out") == 0
+
+
+def test_rle_blocks(tmp_path):
+    data = b"x" * 1000 + b"0123" * 50 + b"y" * 999
+    src = tmp_path / "data.bin"
+    packed = tmp_path / "data.rleb"
+    unpacked = tmp_path / "data.out"
+    src.write_bytes(data)
+    for workers in (1, 2):
+        assert compress_file_blocks(src, packed, block_size=256, workers=workers) == 9
+        assert decompress_file_blocks(packed, unpacked, workers=workers) == len(data)
+        assert unpacked.read_bytes() == data
+    assert read_block(packed, 4) == data[1024:1280], "A single block should decode on its own"
+    try:
+        read_block(packed, 9)
+    except IndexError:
+        pass
+    else:
+        assert False, "read_block past the last block should raise IndexError"
+
+
+def test_rle_blocks_empty(tmp_path):
+    src = tmp_path / "empty.bin"
+    src.write_bytes(b"")
+    assert compress_file_blocks(src, tmp_path / "empty.rleb", workers=1) == 0
+    assert decompress_file_blocks(tmp_path / "empty.rleb", tmp_path / "empty.out", workers=1) == 0
+
+
+def test_rle_blocks_truncated(tmp_path):
+    src = tmp_path / "data.bin"
+    packed = tmp_path / "data.rleb"
+    src.write_bytes(b"ab" * 500)
+    compress_file_blocks(src, packed, block_size=256, workers=1)
+    container = packed.read_bytes()
+    footer = 16
+    truncated = [
+        container[:9],  # header only
+        container[:-footer - 40] + container[-footer:],  # part of the index missing
+    ]
+    for data in truncated:
+        packed.write_bytes(data)
+        with pytest.raises(ValueError):
+            read_block(packed, 0)
+
+
+def test_is_happy():
+    assert is_happy(19) and not is_happy(2)
+    assert count_happy_numbers() == 20
+    assert is_happy(78999), "78999 needs more than 10 steps to reach 1"
+    assert not is_happy(0)
+    for n in range(1, 5000):
+        assert is_happy(n) == _naive_is_happy(n), f"is_happy({n}) is wrong"
+    assert is_happy(10 ** 30) and is_happy(7 * 10 ** 25)
+
+
+def test_happy_ranges():
+    for lo, hi in [(0, 101), (1, 2), (950, 2345), (12345, 12346), (10, 5), (999, 1000)]:
+        expected = [n for n in range(max(lo, 1), hi) if _naive_is_happy(n)]
+        assert list(happy_numbers(lo, hi)) == expected, f"happy_numbers({lo}, {hi}) is wrong"
+        assert count_happy(lo, hi) == len(expected), f"count_happy({lo}, {hi}) is wrong"
+    assert count_happy(1, 10 ** 6 + 1) == 143071
+    assert count_happy(10 ** 6, 10 ** 6 + 54321) == sum(1 for _ in happy_numbers(10 ** 6, 10 ** 6 + 54321))
+
+
+def test_happy_np():
+    np = pytest.importorskip("numpy")
+    from happy_np import sum_square_array, is_happy_array
+
+    nums = np.array([0, 7, 19, 98, 123, 999999, 78999, 2 ** 62, -4], dtype=np.int64)
+    for digits in (1, 2, 3, 4):
+        result = sum_square_array(nums[:-1], digits_per_step=digits)
+        assert result.tolist() == [sum_square(int(n)) for n in nums[:-1]], f"{digits} digits per step failed"
+    assert is_happy_array(nums).tolist() == [is_happy(int(n)) for n in nums]
+    assert is_happy_array(np.arange(1, 101)).sum() == 20
+
+
+def test_benchmarks(tmp_path):
+    results = bench_mmn12.run_benchmarks(sizes=[10, 20], repeat=1)
+    assert set(results) == set(bench_mmn12.BENCHMARKS)
+    assert all(set(timings) == {"10", "20"} for timings in results.values())
+    slower = {name: {size: seconds * 10 for size, seconds in timings.items()}
+              for name, timings in results.items()}
+    assert bench_mmn12.compare(results, results) == []
+    assert len(bench_mmn12.compare(slower, results)) == 8, "Every benchmark should regress"
+
+    baseline = tmp_path / "baseline.json"
+    args = ["--sizes", "10", "--repeat", "1", "--only", "sum_square"]
+    assert bench_mmn12.main(args + ["--save", str(baseline)]) == 0
+    assert bench_mmn12.main(args + ["--compare", str(baseline), "--tolerance", "1000"]) == 0
+
+
+if __name__ == "__main__":
+    test_is_prime_small()
+    test_is_prime_large()
+    test_primes_in_range()
+    test_is_prime_many()
+    test_max_prime_stream()
+    test_max_prime_stream_file()
+    test_compression()
+    test_rle_round_trip()
+    test_rle_compress_into()
+    test_rle_decompress_invalid()
+    test_rle_encoder_chunks()
+    test_is_happy()
+    test_happy_ranges()
+    print("All mmn12 tests passed!")
@@ -0,0 +1,78 @@
+"""
+Analysis of the index walk used by mmn13.is_perfect.
+
+A list of indexes is a functional graph: every index i has one edge to lst[i].
+The walk from 0 follows these edges until it reaches an index it already
+visited, so it is a tail followed by a cycle (the "rho" shape).
+"""
+
+from collections import namedtuple
+from itertools import compress
+
+WalkReport = namedtuple("WalkReport", ["visits_all", "cycle_entry", "cycle_length",
+                                       "tail_length", "unreachable"])
+WalkReport.__doc__ = """
+Result of analyze_walk.
+
+    visits_all (bool): Whether the walk from 0 visits every index.
+    cycle_entry (int or None): First index of the cycle the walk ends in.
+    cycle_length (int): Number of indexes on that cycle.
+    tail_length (int): Number of steps from 0 to cycle_entry.
+    unreachable (list of int): Indexes the walk never visits, in increasing order.
+"""
+
+
+def _check(val, n):
+    """
+    Validate a value that failed the fast range check of the walk.
+
+    Args:
+        val (any): The value found in the list.
+        n (int): Length of the list.
+
+    Raises:
+        TypeError: If val is not an integer.
+        IndexError: If val is out of the list boundaries.
+    """
+    if not isinstance(val, int):
+        raise TypeError("Val must be an Int type!")
+    raise IndexError("The value " + str(val) + " is out of the array boundaries")
+
+
+def analyze_walk(lst):
+    """
+    Walk the index chain from 0 once and describe its shape.
+
+    Every index is visited at most once, so the analysis takes O(n) time.
+    Values are validated inline and an exception is only built when a value
+    is actually invalid.
+
+    Args:
+        lst (list of int or NumPy array): The index table.
+
+    Returns:
+        WalkReport: The shape of the walk (see WalkReport).
+
+    Raises:
+        TypeError: If the walk reaches a value that is not an integer.
+        IndexError: If the walk reaches a value out of the list boundaries.
+    """
+    if hasattr(lst, "tolist"):
+        lst = lst.tolist()  # a single conversion to Python ints
+    n = len(lst)
+    if n == 0:
+        return WalkReport(True, None, 0, 0, [])
+
+    # order[i] is the step at which index i was visited, -1 if never
+    order = [-1] * n
+    step = 0
+    val = 0
+    while order[val] == -1:
+        order[val] = step
+        step += 1
+        val = lst[val]
+        if not isinstance(val, int) or not 0 <= val < n:
+            _check(val, n)
+
+    unreachable = list(compress(range(n), (i == -1 for i in order)))
+    return WalkReport(not unreachable, val, step - order[val], order[val], unreachable)
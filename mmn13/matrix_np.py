@@ -0,0 +1,209 @@
+"""
+NumPy versions of mmn13.identity_matrix and mmn13.max_identity_matrix.
+
+mmn13 switches to these functions when it is given a NumPy array, so NumPy
+is only imported by users who already work with arrays. load_matrix opens
+matrices stored on disk as memory-mapped arrays that these functions (and
+mmn13.create_sub_matrix with view=True) read directly.
+"""
+
+import os
+from math import isqrt
+
+import numpy as np
+
+
+def _as_int_array(mat):
+    """
+    Convert a matrix to a 2D integer NumPy array, without copying arrays.
+
+    Args:
+        mat (array-like): 2D matrix.
+
+    Returns:
+        numpy.ndarray: The matrix as an array.
+
+    Raises:
+        TypeError: If the matrix does not hold integers.
+    """
+    arr = np.asarray(mat)
+    if arr.ndim != 2 or not (np.issubdtype(arr.dtype, np.integer) or arr.dtype == np.bool_):
+        raise TypeError("Not all values are int!")
+    return arr
+
+
+def identity_matrix(mat):
+    """
+    Check if a matrix is an identity matrix, using vectorized comparisons.
+
+    Args:
+        mat (array-like): 2D integer matrix.
+
+    Returns:
+        bool: True if mat is an identity matrix, False otherwise.
+
+    Raises:
+        TypeError: If the matrix does not hold integers.
+    """
+    arr = _as_int_array(mat)
+    rows, cols = arr.shape
+    if rows != cols:
+        return False
+    # with a diagonal of 1s, any other nonzero cell means it's not an identity
+    return bool((arr.diagonal() == 1).all()) and np.count_nonzero(arr) == rows
+
+
+def max_identity_matrix(mat):
+    """
+    Return the size of the largest centered sub-matrix within mat that is an identity matrix.
+
+    A cell at distance r from the center (in rows or columns, whichever is
+    larger) lies on ring r. The centered sub-matrix of size 2r + 1 is an
+    identity exactly when rings 0..r hold 1s on the diagonal and 0s elsewhere,
+    so the search grows from the center with vectorized checks of each new
+    ring and stops at the first ring that fails. No sub-matrix is copied.
+
+    Args:
+        mat (array-like): 2D square integer matrix of odd size.
+
+    Returns:
+        int: Size of the largest identity sub-matrix found.
+
+    Raises:
+        TypeError: If the matrix does not hold integers.
+        IndexError: If matrix is not square or not of odd size.
+    """
+    arr = _as_int_array(mat)
+    size = arr.shape[0]
+    if size == 0:
+        return 0
+    _check_odd_square(arr)
+
+    center = size // 2
+    ring = 0
+    # grow from the center, so only the middle band of a memory-mapped matrix is read
+    while ring <= center and _ring_is_identity(arr, center, ring):
+        ring += 1
+    return 2 * ring - 1 if ring else 0
+
+
+def _check_odd_square(arr):
+    """
+    Validate that an array is a square matrix of odd size.
+
+    Args:
+        arr (numpy.ndarray): 2D matrix.
+
+    Raises:
+        IndexError: If matrix is not square or not of odd size.
+    """
+    if arr.shape[0] % 2 == 0:
+        raise IndexError("The matrix must be odd")
+    if arr.shape[1] != arr.shape[0]:
+        raise IndexError("The matrix must be square")
+
+
+def _ring_is_identity(arr, center, ring):
+    """
+    Check that a ring of the matrix has 1s on the main diagonal and 0s elsewhere.
+
+    The ring is read as four slices: its top and bottom rows, which hold its
+    two diagonal cells, and the columns between them on both sides.
+
+    Args:
+        arr (numpy.ndarray): 2D square matrix.
+        center (int): Index of the center row and column.
+        ring (int): Distance of the ring from the center.
+
+    Returns:
+        bool: True if the ring is identity-consistent, False otherwise.
+    """
+    lo = center - ring
+    hi = center + ring + 1
+    top = arr[lo, lo:hi]
+    bottom = arr[hi - 1, lo:hi]
+    if top[0] != 1 or bottom[-1] != 1:
+        return False
+    if np.count_nonzero(top) != 1 or np.count_nonzero(bottom) != 1:
+        return False
+    return not arr[lo + 1:hi - 1, lo].any() and not arr[lo + 1:hi - 1, hi - 1].any()
+
+
+def _wrong_rings(arr):
+    """
+    Return the ring of every cell that breaks the identity pattern.
+
+    Args:
+        arr (numpy.ndarray): 2D square integer matrix of odd size.
+
+    Returns:
+        numpy.ndarray: For every wrong cell, its distance from the center.
+
+    Raises:
+        IndexError: If matrix is not square or not of odd size.
+    """
+    _check_odd_square(arr)
+
+    size = arr.shape[0]
+    center = size // 2
+    diagonal = np.arange(size)
+    wrong = arr != 0
+    wrong[diagonal, diagonal] = arr.diagonal() != 1
+
+    rows, cols = np.nonzero(wrong)
+    return np.maximum(np.abs(rows - center), np.abs(cols - center))
+
+
+def identity_ring_profile(mat):
+    """
+    Report for every ring around the center whether it is identity-consistent.
+
+    Args:
+        mat (array-like): 2D square integer matrix of odd size.
+
+    Returns:
+        list of bool: Entry r tells whether ring r is identity-consistent.
+
+    Raises:
+        TypeError: If the matrix does not hold integers.
+        IndexError: If matrix is not square or not of odd size.
+    """
+    arr = _as_int_array(mat)
+    if arr.shape[0] == 0:
+        return []
+
+    counts = np.bincount(_wrong_rings(arr), minlength=arr.shape[0] // 2 + 1)
+    return (counts == 0).tolist()
+
+
+def load_matrix(path, dtype=None, shape=None):
+    """
+    Open a matrix stored on disk as a read-only memory-mapped array.
+
+    .npy files carry their own dtype and shape. Raw binary files need a dtype;
+    without a shape they are read as a square matrix. Only the parts of the
+    file that are actually accessed are read from disk.
+
+    Args:
+        path (str or path-like): Path of the .npy or raw binary file.
+        dtype (numpy dtype or None): Type of the cells of a raw file.
+        shape (tuple or None): (rows, columns) of a raw file.
+
+    Returns:
+        numpy.memmap: The matrix, mapped read-only.
+
+    Raises:
+        ValueError: If a raw file has no dtype or its size doesn't fit a square matrix.
+    """
+    if os.fspath(path).endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    if dtype is None:
+        raise ValueError("A dtype is required to load a raw matrix file")
+
+    if shape is None:
+        count = os.path.getsize(path) // np.dtype(dtype).itemsize
+        size = isqrt(count)
+        if size * size != count:
+            raise ValueError("The file doesn't hold a square matrix")
+        shape = (size, size)
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape)
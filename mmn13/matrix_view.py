@@ -0,0 +1,165 @@
+"""
+Square sub-matrix views used by mmn13.create_sub_matrix.
+
+A view keeps a reference to the parent matrix and translates indexes, so
+creating it does not copy any cell. It works over lists of lists as well as
+NumPy arrays and memory-mapped arrays.
+"""
+
+from collections.abc import Sequence
+
+
+def _normalize(i, size):
+    """
+    Translate a possibly negative index and check it is inside the view.
+
+    Args:
+        i (int): Index into the view.
+        size (int): Size of the view.
+
+    Returns:
+        int: The index, between 0 and size - 1.
+
+    Raises:
+        IndexError: If i is out of the view boundaries.
+    """
+    if i < 0:
+        i += size
+    if i < 0 or i >= size:
+        raise IndexError("The index " + str(i) + " is out of the view boundaries")
+    return i
+
+
+def _sequences_equal(a, b):
+    """
+    Compare two sequences item by item.
+
+    Args:
+        a (sequence): First sequence.
+        b (sequence): Second sequence.
+
+    Returns:
+        bool: True if both have the same length and equal items in order.
+    """
+    return len(a) == len(b) and all(x == y for x, y in zip(a, b))
+
+
+class MatrixRow(Sequence):
+    """
+    A row of a MatrixView: the columns offset..offset + size - 1 of a parent row.
+    """
+
+    def __init__(self, row, offset, size):
+        """
+        Initialize a row view.
+
+        Args:
+            row (sequence): The row of the parent matrix.
+            offset (int): Index of the first column of the view.
+            size (int): Number of columns in the view.
+        """
+        self._row = row
+        self._offset = offset
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, j):
+        """
+        Get a cell of the row, or a list of cells for a slice.
+
+        Args:
+            j (int or slice): Column index inside the view.
+
+        Returns:
+            The cell, or a list of cells for a slice.
+
+        Raises:
+            IndexError: If j is out of the view boundaries.
+        """
+        if isinstance(j, slice):
+            return [self._row[self._offset + k] for k in range(*j.indices(self._size))]
+        return self._row[self._offset + _normalize(j, self._size)]
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) and not hasattr(other, "__array__"):
+            return NotImplemented
+        return _sequences_equal(self, other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class MatrixView(Sequence):
+    """
+    A square sub-matrix of size x size cells starting at (offset, offset) of a parent matrix.
+    """
+
+    def __init__(self, mat, offset, size):
+        """
+        Initialize a sub-matrix view.
+
+        Args:
+            mat (list of list or 2D array): The parent matrix.
+            offset (int): Index of the first row and column of the view.
+            size (int): Number of rows and columns in the view.
+
+        Raises:
+            IndexError: If the view doesn't fit inside the parent matrix.
+        """
+        if offset < 0 or size < 0 or offset + size > len(mat):
+            raise IndexError("The sub-matrix is out of the matrix boundaries")
+        self._mat = mat
+        self._offset = offset
+        self._size = size
+
+    def get_offset(self):
+        """
+        Get the index of the first row and column of the view in the parent matrix.
+
+        Returns:
+            int: The offset.
+        """
+        return self._offset
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, i):
+        """
+        Get a row view, a list of row views for a slice, or a cell for an (i, j) pair.
+
+        Args:
+            i (int, slice or tuple): Row index, row slice or (row, column) pair.
+
+        Returns:
+            MatrixRow, list of MatrixRow or a single cell.
+
+        Raises:
+            IndexError: If the index is out of the view boundaries.
+        """
+        if isinstance(i, tuple):
+            row, col = i
+            return self._mat[self._offset + _normalize(row, self._size)][
+                self._offset + _normalize(col, self._size)]
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self._size))]
+        return MatrixRow(self._mat[self._offset + _normalize(i, self._size)], self._offset, self._size)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) and not hasattr(other, "__array__"):
+            return NotImplemented
+        return _sequences_equal(self, other)
+
+    def __repr__(self):
+        return "MatrixView(" + repr(self.materialize()) + ")"
+
+    def materialize(self):
+        """
+        Copy the view into a new list of lists.
+
+        Returns:
+            list of list: The cells of the view.
+        """
+        return [list(row) for row in self]
@@ -4,7 +4,12 @@ The Open University of Israel
 """
 
 
-import copy
+from itertools import compress
+from numbers import Integral
+
+from functional_graph import analyze_walk
+from matrix_view import MatrixView
+from rotation import all_rotation_offsets, rotate_in_place
 
 
 def complement(lst):
@@ -20,31 +25,75 @@ def complement(lst):
     Returns:
         list of int: A list containing the missing integers between 1 and max(lst) - 1.
     """
-    lst_comp = []
+    return list(complement_iter(lst))
 
-    if lst:
-        for i in range(1, max(lst)):
-            exist = False
-            for j in lst:
-                if i == j:
-                    exist = True
-                    break  # Stop searching if value is found
-            if not exist:
-                lst_comp.append(i)
 
-    return lst_comp
+def complement_iter(lst):
+    """
+    Generate the integers between 1 and max(lst) - 1 that are not present in lst.
+
+    The values of lst are marked in a bytearray bitmap in one pass, so the
+    whole scan takes O(n + max(lst)) time instead of O(n * max(lst)).
+
+    Args:
+        lst (list of int): A list of positive integers.
+
+    Yields:
+        int: The next missing integer, in increasing order.
+    """
+    if not lst:
+        return
+
+    top = max(lst)
+    if top <= 1:
+        return
 
+    # missing[i] stays 1 only for the values that never appear in lst
+    missing = bytearray(b"\x01") * top
+    for val in lst:
+        if 0 < val < top:
+            missing[val] = 0
 
-def shift_k_right(lst, k):
+    yield from compress(range(1, top), memoryview(missing)[1:])
+
+
+def complement_sorted(iterable):
+    """
+    Generate the complement of a sorted stream of positive integers.
+
+    The gaps between consecutive values are yielded in a single streaming
+    pass, using O(1) extra memory. Duplicate values are allowed.
+
+    Args:
+        iterable (iterable of int): Positive integers in non-decreasing order.
+
+    Yields:
+        int: The next missing integer between 1 and the last value - 1.
+
+    Raises:
+        ValueError: If the values are not sorted.
+    """
+    prev = 0
+    for val in iterable:
+        if val < prev:
+            raise ValueError("The values must be sorted in increasing order!")
+        if val > prev + 1:
+            yield from range(prev + 1, val)
+        prev = max(prev, val)
+
+
+def shift_k_right(lst, k, in_place=False):
     """
     Shift the list k positions to the right (circularly).
 
     Args:
         lst (list): List to be shifted.
         k (int): Number of positions to shift. Must be between 0 and len(lst).
+        in_place (bool): Rotate lst itself with the reversal algorithm instead of
+            building a new list.
 
     Returns:
-        list: The shifted list.
+        list: The shifted list (lst itself when in_place is True).
 
     Raises:
         ValueError: If k is not in the valid range.
@@ -52,6 +101,8 @@ def shift_k_right(lst, k):
     if k < 0 or k > len(lst):
         raise ValueError("k must be between 0 and lst length!")
 
+    if in_place:
+        return rotate_in_place(lst, k)
     return lst[-k:] + lst[:-k]
 
 
@@ -59,6 +110,9 @@ def shift_right_size(a, b):
     """
     Return the shift size needed to transform list b into list a using right shifts.
 
+    The shift is found in O(n) time by searching a inside b + b
+    (see rotation.all_rotation_offsets).
+
     Args:
         a (list): Target list.
         b (list): Original list to be shifted.
@@ -66,12 +120,10 @@ def shift_right_size(a, b):
     Returns:
         int or str: The number of right shifts needed to match a, or "None" if not possible.
     """
-    if a and b:
-        if a == b:
-            return 0
-        for i in range(1, len(b)):
-            if shift_k_right(b, i) == a:
-                return i
+    if len(a) and len(b):
+        offsets = all_rotation_offsets(a, b)
+        if offsets:
+            return offsets[0]
     return "None"
 
 
@@ -98,33 +150,35 @@ def is_perfect(lst):
     Determine if a list forms a perfect sequence.
 
     The sequence starts at index 0, and at each step jumps to the value at the current index.
-    A perfect list visits all indices and ends by looping or reaching 0.
+    A perfect list visits all indices and ends by reaching 0 again.
+    The walk is analyzed in a single O(n) pass by functional_graph.analyze_walk.
 
     Args:
-        lst (list): List of integers.
+        lst (list or NumPy array): List of integers.
 
     Returns:
         bool: True if list is perfect, False otherwise.
+
+    Raises:
+        TypeError: If the walk reaches a value that is not an integer.
+        IndexError: If the walk reaches a value out of the list boundaries.
     """
-    result = True
+    report = analyze_walk(lst)
+    # a walk that visits everything and whose cycle starts at 0 is a single cycle
+    return report.visits_all and report.tail_length == 0
 
-    if lst:
-        test = [0] * len(lst)
-        val = 0
-        done = False
 
-        while not done:
-            test[val] = 1
-            val = lst[val]
-            is_valid(val, lst)
-            if val == 0 or val == lst[val]:
-                done = True
+def _is_array(mat):
+    """
+    Check whether a matrix is a NumPy array (or any array with a shape).
 
-        for i in range(len(test)):
-            if test[i] == 0:
-                result = False
+    Args:
+        mat (any): The matrix to check.
 
-    return result
+    Returns:
+        bool: True if mat has a shape attribute, False otherwise.
+    """
+    return hasattr(mat, "shape")
 
 
 def identity_matrix(mat):
@@ -132,9 +186,10 @@ def identity_matrix(mat):
     Check if a matrix is an identity matrix.
 
     An identity matrix has 1s on the main diagonal and 0s elsewhere.
+    NumPy arrays are checked with vectorized comparisons by matrix_np.
 
     Args:
-        mat (list of list of int): 2D square matrix.
+        mat (list of list of int or NumPy array): 2D square matrix.
 
     Returns:
         bool: True if mat is an identity matrix, False otherwise.
@@ -142,6 +197,10 @@ def identity_matrix(mat):
     Raises:
         TypeError: If a non-integer value is found.
     """
+    if _is_array(mat):
+        import matrix_np  # NumPy is only needed for array input
+        return matrix_np.identity_matrix(mat)
+
     if mat:
         row_length = len(mat)
         column_length = len(mat[0])
@@ -151,7 +210,7 @@ def identity_matrix(mat):
 
         for i in range(row_length):
             for j in range(column_length):
-                if not isinstance(mat[i][j], int):
+                if not isinstance(mat[i][j], Integral):
                     raise TypeError("Not all values are int!")
                 # check the main diagonal
                 if i == j:
@@ -165,36 +224,54 @@ def identity_matrix(mat):
     return True
 
 
-def create_sub_matrix(mat, size):
+def _check_odd_matrix(mat):
+    """
+    Validate that a matrix has an odd number of rows, all of equal length.
+
+    Args:
+        mat (list of list of int): 2D matrix.
+
+    Raises:
+        IndexError: If matrix is not of odd size or its rows differ in length.
+    """
+    if len(mat) % 2 == 0:
+        raise IndexError("The matrix must be odd")
+
+    # check all rows and columns same length
+    row_length = len(mat[0])
+    for row in mat:
+        if len(row) != row_length:
+            raise IndexError("Matrix rows must have equal length")
+
+
+def create_sub_matrix(mat, size, view=False):
     """
     Extract a centered sub-matrix of the given size from mat.
 
     Args:
         mat (list of list of int): Original 2D matrix.
         size (int): Size of the desired sub-matrix.
+        view (bool): Return a MatrixView over mat instead of copying the cells.
+            Call materialize() on the view when a copy is really needed.
 
     Returns:
-        list of list of int: Centered sub-matrix.
+        list of list of int or MatrixView: Centered sub-matrix.
 
     Raises:
         IndexError: If matrix is not square or not of odd size.
     """
     sub_matrix = []
 
-    if mat:
-        if len(mat) % 2 == 0:
-            raise IndexError("The matrix must be odd")
-
-        # check all rows and columns same length
-        row_length = len(mat[0])
-        for row in mat:
-            if len(row) != row_length:
-                raise IndexError("Matrix rows must have equal length")
+    if len(mat):
+        _check_odd_matrix(mat)
 
         # find the center and adjust offset to use from both sides
         center = len(mat) // 2
         offset = size // 2
 
+        if view:
+            return MatrixView(mat, center - offset, 2 * offset + 1)
+
         for i in range(center - offset, center + offset + 1):
             row = []
             for j in range(center - offset, center + offset + 1):
@@ -208,26 +285,104 @@ def max_identity_matrix(mat):
     """
     Return the size of the largest centered sub-matrix within mat that is an identity matrix.
 
+    The search grows from the center outward: ring r holds the cells at distance r
+    from the center, and the sub-matrix of size 2r + 1 is an identity exactly when
+    rings 0..r are (see identity_ring_profile). Only the new ring is checked at each
+    size, so the search is O(n^2) in total and stops at the first ring that fails.
+    NumPy arrays are searched by matrix_np with vectorized comparisons.
+
     Args:
-        mat (list of list of int): 2D matrix to search within.
+        mat (list of list of int or NumPy array): 2D matrix to search within.
 
     Returns:
         int: Size of the largest identity sub-matrix found.
+
+    Raises:
+        IndexError: If matrix is not of odd size or its rows differ in length.
     """
-    max_mat = []
+    if _is_array(mat):
+        import matrix_np  # NumPy is only needed for array input
+        try:
+            return matrix_np.max_identity_matrix(mat)
+        except TypeError as e:
+            print(f"TypeError caught: {e}")
+            return 0
 
-    if mat:
-        max_size = len(mat)
-
-        # iterate from the outer layer of the mat inside and search for identity matrix
-        for size in range(max_size, 0, -1):
-            try:
-                sub_matrix = create_sub_matrix(mat, size)
-                if sub_matrix and identity_matrix(sub_matrix):
-                    max_mat = copy.deepcopy(sub_matrix)
-                    break
-            except TypeError as e:
-                print(f"TypeError caught: {e}")
-                return 0
-
-    return len(max_mat)
+    if not mat:
+        return 0
+
+    _check_odd_matrix(mat)
+    center = len(mat) // 2
+    ring = 0
+
+    try:
+        # grow from the center until a ring is not identity-consistent
+        while ring <= center and _ring_is_identity(mat, center, ring):
+            ring += 1
+    except TypeError as e:
+        print(f"TypeError caught: {e}")
+        return 0
+
+    return 2 * ring - 1 if ring else 0
+
+
+def _ring_is_identity(mat, center, ring):
+    """
+    Check that a ring of the matrix has 1s on the main diagonal and 0s elsewhere.
+
+    Args:
+        mat (list of list of int): 2D matrix.
+        center (int): Index of the center row and column.
+        ring (int): Distance of the ring from the center.
+
+    Returns:
+        bool: True if the ring is identity-consistent, False otherwise.
+
+    Raises:
+        TypeError: If a non-integer value is found.
+    """
+    lo = center - ring
+    hi = center + ring
+
+    for i in range(lo, hi + 1):
+        row = mat[i]
+        # the top and bottom rows belong to the ring, the others only at both ends
+        columns = range(lo, hi + 1) if i == lo or i == hi else (lo, hi)
+        for j in columns:
+            val = row[j]
+            if not isinstance(val, Integral):
+                raise TypeError("Not all values are int!")
+            if val != (1 if i == j else 0):
+                return False
+
+    return True
+
+
+def identity_ring_profile(mat):
+    """
+    Report for every ring around the center whether it is identity-consistent.
+
+    Ring r holds the cells at distance r from the center (in rows or columns,
+    whichever is larger). It is identity-consistent when its diagonal cells are
+    1 and the rest are 0.
+
+    Args:
+        mat (list of list of int or NumPy array): 2D matrix of odd size.
+
+    Returns:
+        list of bool: Entry r tells whether ring r is identity-consistent.
+
+    Raises:
+        TypeError: If a non-integer value is found.
+        IndexError: If matrix is not of odd size or its rows differ in length.
+    """
+    if _is_array(mat):
+        import matrix_np  # NumPy is only needed for array input
+        return matrix_np.identity_ring_profile(mat)
+
+    if not mat:
+        return []
+
+    _check_odd_matrix(mat)
+    center = len(mat) // 2
+    return [_ring_is_identity(mat, center, ring) for ring in range(center + 1)]
@@ -0,0 +1,312 @@
+"""
+Circular rotation helpers used by mmn13.shift_k_right and mmn13.shift_right_size.
+"""
+
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+
+
+class RotatedView(Sequence):
+    """
+    Read-only view of a sequence shifted k positions to the right (circularly).
+
+    The view keeps a reference to the underlying sequence and translates
+    indexes, so creating it takes O(1) time and memory. Changes to the
+    underlying sequence are visible through the view.
+    """
+
+    def __init__(self, seq, k):
+        """
+        Initialize a rotated view.
+
+        Args:
+            seq (sequence): The underlying list, array.array or NumPy array.
+            k (int): Number of positions to shift right, any integer (taken modulo len(seq)).
+        """
+        self._seq = seq
+        self._k = k % len(seq) if len(seq) else 0
+
+    def get_shift(self):
+        """
+        Get the right shift of the view.
+
+        Returns:
+            int: The shift, between 0 and len(seq) - 1.
+        """
+        return self._k
+
+    def __len__(self):
+        return len(self._seq)
+
+    def __getitem__(self, i):
+        """
+        Get an item, or a list of items for a slice, of the rotated sequence.
+
+        Args:
+            i (int or slice): Index in the rotated sequence.
+
+        Returns:
+            The item at index i, or a list for a slice.
+
+        Raises:
+            IndexError: If i is out of the sequence boundaries.
+        """
+        n = len(self._seq)
+        if isinstance(i, slice):
+            return [self._seq[(j - self._k) % n] for j in range(*i.indices(n))]
+        if i < -n or i >= n:
+            raise IndexError("The index " + str(i) + " is out of the sequence boundaries")
+        return self._seq[(i - self._k) % n]
+
+    def __iter__(self):
+        split = len(self._seq) - self._k
+        return chain(islice(self._seq, split, None), islice(self._seq, split))
+
+    def __eq__(self, other):
+        """
+        Compare the rotated sequence to another sequence, item by item.
+
+        Args:
+            other (sequence): A list, tuple, array or another RotatedView.
+
+        Returns:
+            bool: True if both have the same length and the same items in order.
+                  Returns NotImplemented if other is not a sequence.
+        """
+        if not isinstance(other, Sequence) and not hasattr(other, "__array__"):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __repr__(self):
+        return "RotatedView(" + repr(list(self)) + ")"
+
+    def materialize(self):
+        """
+        Copy the rotated sequence into a new list.
+
+        Returns:
+            list: The rotated items.
+        """
+        return list(self)
+
+
+def _reverse(seq, lo, hi):
+    """
+    Reverse seq[lo:hi] in place by swapping items from both ends.
+
+    Args:
+        seq (mutable sequence): The sequence to change.
+        lo (int): First index of the part to reverse.
+        hi (int): Index one past the last item of the part to reverse.
+    """
+    hi -= 1
+    while lo < hi:
+        seq[lo], seq[hi] = seq[hi], seq[lo]
+        lo += 1
+        hi -= 1
+
+
+def rotate_in_place(seq, k):
+    """
+    Shift a mutable sequence k positions to the right (circularly), in place.
+
+    Uses the reversal algorithm: reverse the whole sequence, then reverse the
+    first k items and the rest separately. Takes O(n) time and O(1) extra memory.
+
+    Args:
+        seq (mutable sequence): A list, array.array or NumPy array.
+        k (int): Number of positions to shift right (taken modulo len(seq)).
+
+    Returns:
+        The same sequence, rotated.
+    """
+    n = len(seq)
+    if n:
+        k %= n
+        if k:
+            _reverse(seq, 0, n)
+            _reverse(seq, 0, k)
+            _reverse(seq, k, n)
+    return seq
+
+
+def _prefix_function(pattern):
+    """
+    Compute the Knuth-Morris-Pratt prefix function of a sequence.
+
+    Args:
+        pattern (sequence): The sequence to analyze.
+
+    Returns:
+        list of int: Entry j is the length of the longest proper prefix of
+        pattern[:j + 1] that is also its suffix.
+    """
+    fail = [0] * len(pattern)
+    k = 0
+    for j in range(1, len(pattern)):
+        while k and pattern[j] != pattern[k]:
+            k = fail[k - 1]
+        if pattern[j] == pattern[k]:
+            k += 1
+        fail[j] = k
+    return fail
+
+
+def all_rotation_offsets(a, b):
+    """
+    Return every right shift that transforms b into a.
+
+    a is searched with Knuth-Morris-Pratt inside b + b (indexed circularly,
+    without building it). A match at position p means shifting b right by
+    (n - p) % n gives a. Takes O(n) time; periodic sequences have several offsets.
+
+    Args:
+        a (sequence): Target sequence.
+        b (sequence): Original sequence to be shifted.
+
+    Returns:
+        list of int: The offsets k in range(len(b)) such that shifting b k
+        positions to the right gives a, in increasing order.
+    """
+    n = len(b)
+    if len(a) != n:
+        return []
+    if n == 0:
+        return [0]
+
+    fail = _prefix_function(a)
+    offsets = []
+    k = 0
+    # positions 0..2n-2 of b + b hold every rotation of b exactly once
+    for j in range(2 * n - 1):
+        item = b[j % n]
+        while k and item != a[k]:
+            k = fail[k - 1]
+        if item == a[k]:
+            k += 1
+        if k == n:
+            offsets.append((n - (j - n + 1)) % n)
+            k = fail[k - 1]
+
+    offsets.sort()
+    return offsets
+
+
+def least_rotation(seq):
+    """
+    Find the start of the lexicographically least rotation with Booth's algorithm.
+
+    Args:
+        seq (sequence): A sequence of comparable items.
+
+    Returns:
+        int: Index r such that seq[r:] + seq[:r] is the least rotation of seq
+        (0 for an empty sequence).
+    """
+    n = len(seq)
+    fail = [-1] * (2 * n)
+    k = 0
+    for j in range(1, 2 * n):
+        item = seq[j % n]
+        i = fail[j - k - 1]
+        while i != -1 and item != seq[(k + i + 1) % n]:
+            if item < seq[(k + i + 1) % n]:
+                k = j - i - 1
+            i = fail[i]
+        if i == -1 and item != seq[k % n]:
+            if item < seq[k % n]:
+                k = j
+            fail[j - k] = -1
+        else:
+            fail[j - k] = i + 1
+    return k % n if n else 0
+
+
+def canonical_rotation(seq):
+    """
+    Return the least rotation of a sequence as a hashable key.
+
+    Two sequences are rotations of each other exactly when their canonical
+    rotations are equal.
+
+    Args:
+        seq (sequence): A sequence of comparable, hashable items.
+
+    Returns:
+        tuple: The items of the least rotation.
+    """
+    return tuple(RotatedView(seq, -least_rotation(seq)))
+
+
+def _first_offset(pair):
+    """
+    Return the smallest right shift that transforms pair[1] into pair[0].
+
+    Args:
+        pair (tuple): (a, b) sequences.
+
+    Returns:
+        int or None: The smallest offset, or None if a is not a rotation of b.
+    """
+    offsets = all_rotation_offsets(*pair)
+    return offsets[0] if offsets else None
+
+
+def _map(func, items, workers, chunksize=16):
+    """
+    Apply func to every item, in a process pool unless workers is 1.
+
+    Args:
+        func (callable): Module-level function to apply.
+        items (list): The items.
+        workers (int or None): Number of processes, None for one per CPU.
+        chunksize (int): Number of items sent to a process at a time.
+
+    Returns:
+        list: The results of func, in order.
+    """
+    if workers == 1:
+        return [func(item) for item in items]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, items, chunksize=chunksize))
+
+
+def group_rotations(seqs, workers=None):
+    """
+    Group sequences that are rotations of each other.
+
+    The canonical rotation of every sequence is computed (in a process pool
+    when workers is not 1) and the sequences are bucketed by it, so N
+    sequences of length n take O(N * n) work instead of N ** 2 comparisons.
+
+    Args:
+        seqs (list of sequence): The sequences to group.
+        workers (int or None): Number of processes, None for one per CPU.
+
+    Returns:
+        list of list of int: Indexes into seqs, one list per group of
+        rotations, ordered by the first index of every group.
+    """
+    seqs = list(seqs)
+    groups = {}
+    for i, key in enumerate(_map(canonical_rotation, seqs, workers)):
+        groups.setdefault(key, []).append(i)
+    return list(groups.values())
+
+
+def align_pairs(pairs, workers=None):
+    """
+    Find the rotation offset of many (a, b) pairs of sequences.
+
+    Args:
+        pairs (list of tuple): (a, b) pairs of sequences.
+        workers (int or None): Number of processes, None for one per CPU.
+
+    Returns:
+        list of int or None: For every pair, the smallest right shift that
+        transforms b into a, or None if a is not a rotation of b.
+    """
+    return _map(_first_offset, list(pairs), workers)
@@ -0,0 +1,247 @@
+"""
+Test module for the mmn13 list and matrix functions.
+"""
+
+from array import array
+
+import pytest
+
+from mmn13 import complement, complement_iter, complement_sorted, shift_k_right, shift_right_size, is_perfect
+from mmn13 import identity_matrix, max_identity_matrix, identity_ring_profile, create_sub_matrix
+from matrix_view import MatrixView
+from functional_graph import analyze_walk
+from rotation import RotatedView, rotate_in_place, all_rotation_offsets
+from rotation import least_rotation, canonical_rotation, group_rotations, align_pairs
+
+
+def test_complement():
+    assert complement([4, 1, 6, 2]) == [3, 5]
+    assert complement([]) == []
+    assert complement([1]) == []
+    assert complement([5, 5, 3]) == [1, 2, 4], "Duplicates should be ignored"
+    assert list(complement_iter([10, 2])) == [1, 3, 4, 5, 6, 7, 8, 9]
+
+
+def test_complement_sorted():
+    assert list(complement_sorted(iter([1, 2, 2, 5, 9]))) == complement([1, 2, 2, 5, 9])
+    assert list(complement_sorted([])) == []
+    try:
+        list(complement_sorted([3, 1]))
+    except ValueError:
+        pass
+    else:
+        assert False, "Unsorted input should raise ValueError"
+
+
+def test_shift_k_right():
+    lst = [1, 2, 3, 4, 5]
+    assert shift_k_right(lst, 2) == [4, 5, 1, 2, 3]
+    assert shift_k_right(lst, 0) == lst and shift_k_right(lst, 5) == lst
+    assert shift_k_right(lst, 2, in_place=True) is lst
+    assert lst == [4, 5, 1, 2, 3]
+    assert shift_right_size([4, 5, 1, 2, 3], [1, 2, 3, 4, 5]) == 2
+    assert shift_right_size([1, 2, 3], [1, 3, 2]) == "None"
+
+
+def test_rotated_view():
+    lst = [1, 2, 3, 4, 5]
+    view = RotatedView(lst, 2)
+    assert view == [4, 5, 1, 2, 3] and [4, 5, 1, 2, 3] == view
+    assert view != [1, 2, 3, 4, 5]
+    assert list(view) == view.materialize() == shift_k_right(lst, 2)
+    assert view[0] == 4 and view[-1] == 3 and view[1:4] == [5, 1, 2] and view[::-2] == [3, 1, 4]
+    assert len(view) == 5 and 5 in view and view.index(1) == 2
+    assert RotatedView(lst, 7) == view, "Shift is taken modulo the length"
+    assert RotatedView([], 3) == []
+    try:
+        view[5]
+    except IndexError:
+        pass
+    else:
+        assert False, "Index past the end should raise IndexError"
+
+
+def test_rotate_in_place():
+    for k in range(-3, 10):
+        for n in range(0, 7):
+            lst = list(range(n))
+            expected = list(RotatedView(lst, k))
+            assert rotate_in_place(lst, k) == expected, f"Rotating {n} items by {k} failed"
+    arr = array("i", [1, 2, 3, 4])
+    assert rotate_in_place(arr, 1) == array("i", [4, 1, 2, 3])
+
+
+def test_all_rotation_offsets():
+    assert all_rotation_offsets([1, 2, 1, 2], [2, 1, 2, 1]) == [1, 3]
+    assert all_rotation_offsets([7, 7, 7], [7, 7, 7]) == [0, 1, 2]
+    assert all_rotation_offsets([1, 2], [1, 2, 3]) == []
+    assert all_rotation_offsets([], []) == [0]
+    b = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+    for k in range(len(b)):
+        a = shift_k_right(b, k)
+        assert all_rotation_offsets(a, b) == [k], f"Offset {k} not found"
+        assert shift_right_size(a, b) == k
+    assert shift_right_size([1, 2, 1, 2], [2, 1, 2, 1]) == 1, "The smallest shift should be returned"
+
+
+def test_least_rotation():
+    for seq in ([], [5], [2, 1], [1, 1, 1], [3, 1, 2, 1, 2], [1, 2, 1, 2, 1, 1], list("bbaaccaadd")):
+        rotations = [list(RotatedView(seq, -r)) for r in range(len(seq))] or [[]]
+        least = list(RotatedView(seq, -least_rotation(seq))) if seq else []
+        assert least == min(rotations), f"least_rotation({seq}) is wrong"
+    assert canonical_rotation([3, 1, 2]) == canonical_rotation([2, 3, 1]) == (1, 2, 3)
+
+
+def test_batch_rotations():
+    seqs = [[1, 2, 3], [3, 1, 2], [1, 3, 2], [2, 1, 3], [2, 3, 1], [9]]
+    for workers in (1, 2):
+        assert group_rotations(seqs, workers=workers) == [[0, 1, 4], [2, 3], [5]]
+    pairs = [([3, 1, 2], [1, 2, 3]), ([1, 3, 2], [1, 2, 3]), ([1, 2, 1, 2], [2, 1, 2, 1])]
+    assert align_pairs(pairs, workers=2) == [1, None, 1]
+    assert align_pairs(pairs, workers=1) == [1, None, 1]
+
+
+def test_is_perfect():
+    assert is_perfect([3, 0, 1, 2]) and is_perfect([0]) and is_perfect([])
+    assert not is_perfect([1, 1]), "Ending in a fixed point is not perfect"
+    assert not is_perfect([2, 0, 1, 0]), "Index 3 is never visited"
+    assert not is_perfect([1, 2, 1]), "A cycle that doesn't return to 0 is not perfect"
+    for bad, error in (([1, 5], IndexError), ([1, "x"], TypeError), ([-1], IndexError)):
+        try:
+            is_perfect(bad)
+        except error:
+            continue
+        assert False, f"is_perfect({bad}) should raise {error.__name__}"
+
+
+def test_analyze_walk():
+    report = analyze_walk([1, 2, 3, 4, 2, 0])
+    assert report.cycle_entry == 2 and report.cycle_length == 3 and report.tail_length == 2
+    assert report.unreachable == [5] and not report.visits_all
+    report = analyze_walk([1, 2, 0])
+    assert report.visits_all and report.cycle_entry == 0 and report.cycle_length == 3
+
+
+def _matrix(size, identity_size, noise=7):
+    """A size x size matrix whose centered identity_size block is an identity."""
+    mat = [[noise] * size for _ in range(size)]
+    center = size // 2
+    for i in range(center - identity_size // 2, center + identity_size // 2 + 1):
+        for j in range(center - identity_size // 2, center + identity_size // 2 + 1):
+            mat[i][j] = 1 if i == j else 0
+    return mat
+
+
+def test_identity_matrix():
+    assert identity_matrix([[1, 0], [0, 1]])
+    assert not identity_matrix([[1, 0], [1, 1]])
+    assert not identity_matrix([[1, 0, 0], [0, 1, 0]])
+    for size, identity_size in ((7, 3), (7, 7), (9, 1), (5, 5)):
+        assert max_identity_matrix(_matrix(size, identity_size)) == identity_size
+    mat = _matrix(7, 7)
+    mat[3][3] = 0
+    assert max_identity_matrix(mat) == 0, "A wrong center means no identity"
+    assert max_identity_matrix([]) == 0
+
+
+def test_identity_matrix_np():
+    np = pytest.importorskip("numpy")
+    assert identity_matrix(np.eye(4, dtype=int)) and not identity_matrix(np.ones((3, 3), dtype=int))
+    for size, identity_size in ((7, 3), (7, 7), (9, 1), (11, 5)):
+        mat = _matrix(size, identity_size)
+        assert max_identity_matrix(np.array(mat)) == max_identity_matrix(mat) == identity_size
+    mat = np.array(_matrix(5, 5))
+    mat[2, 2] = 3
+    assert max_identity_matrix(mat) == 0
+    assert max_identity_matrix(np.eye(3)) == 0, "Float matrices are rejected like in the list version"
+    try:
+        max_identity_matrix(np.eye(4, dtype=int))
+    except IndexError:
+        pass
+    else:
+        assert False, "Even matrices should raise IndexError"
+
+
+def test_identity_ring_profile():
+    mat = _matrix(9, 5)
+    assert identity_ring_profile(mat) == [True, True, True, False, False]
+    mat = _matrix(9, 9)
+    mat[2][5] = 3
+    assert identity_ring_profile(mat) == [True, True, False, True, True], "Rings are reported independently"
+    assert max_identity_matrix(mat) == 3
+    assert identity_ring_profile([[1]]) == [True]
+    assert identity_ring_profile([]) == []
+    mat = _matrix(5, 5)
+    mat[0][2] = 0.0
+    try:
+        identity_ring_profile(mat)
+    except TypeError:
+        pass
+    else:
+        assert False, "Non-integer values should raise TypeError"
+    assert max_identity_matrix(mat) == 0
+
+
+def test_identity_ring_profile_np():
+    np = pytest.importorskip("numpy")
+    for size, identity_size in ((9, 5), (7, 7), (5, 1)):
+        mat = _matrix(size, identity_size)
+        assert identity_ring_profile(np.array(mat)) == identity_ring_profile(mat)
+
+
+def test_create_sub_matrix_view():
+    mat = [[r * 10 + c for c in range(5)] for r in range(5)]
+    copy = create_sub_matrix(mat, 3)
+    view = create_sub_matrix(mat, 3, view=True)
+    assert isinstance(view, MatrixView) and view.get_offset() == 1
+    assert view == copy and view.materialize() == copy == [[11, 12, 13], [21, 22, 23], [31, 32, 33]]
+    assert view[0][0] == 11 and view[-1][-1] == 33 and view[1, 2] == 23
+    assert view[1][0:2] == [21, 22] and view[1:] == copy[1:]
+    assert [list(row) for row in view] == copy and len(view) == 3
+    mat[2][2] = 99
+    assert view[1][1] == 99, "The view should see changes to the parent matrix"
+    assert create_sub_matrix(mat, 4, view=True) == mat, "Even sizes round up, like the copying version"
+    assert identity_matrix(create_sub_matrix(_matrix(7, 3), 3, view=True))
+    try:
+        view[3]
+    except IndexError:
+        pass
+    else:
+        assert False, "Row past the end should raise IndexError"
+
+
+def test_load_matrix(tmp_path):
+    np = pytest.importorskip("numpy")
+    from matrix_np import load_matrix
+
+    mat = np.array(_matrix(9, 5), dtype=np.int32)
+    np.save(tmp_path / "mat.npy", mat)
+    mat.tofile(tmp_path / "mat.bin")
+    for mapped in (load_matrix(tmp_path / "mat.npy"), load_matrix(tmp_path / "mat.bin", dtype=np.int32)):
+        assert isinstance(mapped, np.memmap) and mapped.shape == (9, 9)
+        assert max_identity_matrix(mapped) == 5
+        assert identity_matrix(create_sub_matrix(mapped, 5, view=True))
+        assert identity_ring_profile(mapped) == [True, True, True, False, False]
+    try:
+        load_matrix(tmp_path / "mat.bin", dtype=np.int64)
+    except ValueError:
+        pass
+    else:
+        assert False, "A raw file that isn't a square matrix should raise ValueError"
+
+
+if __name__ == "__main__":
+    test_complement()
+    test_complement_sorted()
+    test_shift_k_right()
+    test_rotated_view()
+    test_rotate_in_place()
+    test_all_rotation_offsets()
+    test_least_rotation()
+    test_batch_rotations()
+    test_is_perfect()
+    test_analyze_walk()
+    test_identity_matrix()
+    test_identity_ring_profile()
+    test_create_sub_matrix_view()
+    print("All mmn13 tests passed!")
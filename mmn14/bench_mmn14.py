@@ -0,0 +1,235 @@
+"""
+Benchmark runner comparing the mmn14 functions to their original recursive versions.
+
+For every function and input size it reports the time per element and the
+deepest call stack reached during the call, for the current (iterative)
+version and for the recursive original kept below as a reference. The
+recursive versions fail with RecursionError once the input is longer than
+the recursion limit, while the stack of the current versions stays flat.
+
+Usage:
+    python bench_mmn14.py
+    python bench_mmn14.py --sizes 100 500 5000 --repeat 3
+"""
+
+import argparse
+import sys
+import timeit
+
+from mmn14 import find_max, update_list, equal_lists, is_palindrome, string_is_palindrome
+
+SIZES = [100, 500, 5000, 100000]
+REPEAT = 5
+
+
+# ===== The original recursive versions, kept as a reference =====
+
+def recursive_find_max(lst):
+    def helper(lst, start, end):
+        if start <= end:
+            if start == end:
+                return lst[start]
+            mid = (start + end) // 2
+            left = max(lst[start], lst[mid])
+            right = max(lst[mid + 1], lst[end])
+            if left > right:
+                return helper(lst, start, mid)
+            else:
+                return helper(lst, mid + 1, end)
+        return "None"
+
+    if lst:
+        return helper(lst, 0, len(lst) - 1)
+    return "None"
+
+
+def recursive_update_list(lst, value, i=0):
+    if lst:
+        if lst[i] == value:
+            return lst[:i] + lst[i + 1:]
+        elif i + 1 >= len(lst):
+            return lst
+        else:
+            return recursive_update_list(lst, value, i + 1)
+    return lst
+
+
+def recursive_equal_lists(lst1, lst2):
+    if lst1 == lst2 == []:
+        return True
+    elif lst1 == [] or lst2 == []:
+        return False
+    else:
+        lst2 = recursive_update_list(lst2, lst1[0])
+        return recursive_equal_lists(lst1[1:], lst2)
+
+
+def recursive_string_is_palindrome(string):
+    if len(string) <= 1:
+        return True
+    if string[0] != string[-1]:
+        return False
+    else:
+        return recursive_string_is_palindrome(string[1:-1])
+
+
+def recursive_is_palindrome(lst):
+    if len(lst) <= 1:
+        if lst and not recursive_string_is_palindrome(lst[0]):
+            return False
+        else:
+            return True
+    elif lst[0] != lst[-1] or not recursive_string_is_palindrome(lst[0]):
+        return False
+    else:
+        return recursive_is_palindrome(lst[1:-1])
+
+
+# ===== Inputs =====
+
+def _rotated_input(size):
+    """A sorted list of size values rotated by a third."""
+    values = list(range(size))
+    return (values[size // 3:] + values[:size // 3],)
+
+
+def _update_input(size):
+    """A list whose only copy of the removed value is last (worst case)."""
+    return list(range(size)), size - 1
+
+
+def _equal_input(size):
+    """Two lists with the same values in opposite orders."""
+    values = [i % 97 for i in range(size)]
+    return values, values[::-1]
+
+
+def _palindrome_list_input(size):
+    """A palindromic list of size short palindromic strings."""
+    return (["abcba", "xyyx"] * (size // 4) + ["q"] + ["xyyx", "abcba"] * (size // 4),)
+
+
+def _palindrome_string_input(size):
+    """A palindromic string of length about size."""
+    half = "".join(chr(97 + i % 26) for i in range(size // 2))
+    return (half + half[::-1],)
+
+
+# name -> (input builder, current version, recursive original)
+BENCHMARKS = {
+    "find_max": (_rotated_input, find_max, recursive_find_max),
+    "update_list": (_update_input, update_list, recursive_update_list),
+    "equal_lists": (_equal_input, equal_lists, recursive_equal_lists),
+    "is_palindrome": (_palindrome_list_input, is_palindrome, recursive_is_palindrome),
+    "string_is_palindrome": (_palindrome_string_input, string_is_palindrome, recursive_string_is_palindrome),
+}
+
+
+def max_stack_depth(func, *args):
+    """
+    Measures the deepest Python call stack reached while calling func.
+
+    The depth is counted relative to the caller, so a function that calls no
+    other Python function has depth 1. func is called once before measuring,
+    so one-time work such as filling caches is not counted.
+
+    :param func: callable - the function to measure
+    :param args: arguments for func
+    :return: int or None - the maximum depth, or None if func raised RecursionError
+    """
+    depth = 0
+    deepest = 0
+
+    def profile(frame, event, arg):
+        nonlocal depth, deepest
+        if event == "call":
+            depth += 1
+            deepest = max(deepest, depth)
+        elif event == "return":
+            depth -= 1
+
+    try:
+        func(*args)
+    except RecursionError:
+        return None
+
+    sys.setprofile(profile)
+    try:
+        func(*args)
+    except RecursionError:
+        return None
+    finally:
+        sys.setprofile(None)
+    return deepest
+
+
+def run_benchmarks(sizes=SIZES, repeat=REPEAT, names=None):
+    """
+    Times and measures the stack of the current and recursive versions of every function.
+
+    :param sizes: List[int] - input sizes to sweep
+    :param repeat: int - number of timed runs; the fastest one is kept
+    :param names: List[str] or None - benchmarks to run, None for all of them
+    :return: dict - {benchmark name: {str(size): {"current": {...}, "recursive": {...}}}}, where
+             every inner dict holds "per_element" seconds and "stack" depth (None when
+             the version raised RecursionError)
+    """
+    results = {}
+    for name, (build, current, recursive) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        results[name] = {}
+        for size in sizes:
+            args = build(size)
+            row = {}
+            for label, func in (("current", current), ("recursive", recursive)):
+                stack = max_stack_depth(func, *args)
+                per_element = None
+                if stack is not None:
+                    seconds = min(timeit.repeat(lambda: func(*args), number=1, repeat=repeat))
+                    per_element = seconds / size
+                row[label] = {"per_element": per_element, "stack": stack}
+            results[name][str(size)] = row
+    return results
+
+
+def print_results(results):
+    """
+    Prints the results as a table.
+
+    :param results: dict - results of run_benchmarks
+    """
+    print(f"{'function':<22}{'size':>8}  {'current ns/elem':>16}{'stack':>7}"
+          f"  {'recursive ns/elem':>18}{'stack':>7}")
+    for name, sizes in results.items():
+        for size, row in sizes.items():
+            cells = []
+            for label, width in (("current", 16), ("recursive", 18)):
+                per_element = row[label]["per_element"]
+                stack = row[label]["stack"]
+                if stack is None:
+                    cells.append(f"{'RecursionError':>{width}}{'-':>7}")
+                else:
+                    cells.append(f"{per_element * 1e9:>{width}.1f}{stack:>7}")
+            print(f"{name:<22}{size:>8}  " + "  ".join(cells))
+
+
+def main(argv=None):
+    """
+    Runs the benchmarks from the command line.
+
+    :param argv: List[str] or None - command line arguments, None for sys.argv
+    :return: int - exit code, always 0
+    """
+    parser = argparse.ArgumentParser(description="Compare the mmn14 functions to their recursive originals.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="input sizes to sweep")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed runs per benchmark")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="benchmarks to run")
+    args = parser.parse_args(argv)
+
+    print_results(run_benchmarks(args.sizes, args.repeat, args.only))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
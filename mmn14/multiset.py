@@ -0,0 +1,71 @@
+"""
+Order-independent (multiset) comparison helpers used by mmn14.equal_lists.
+"""
+
+from collections import Counter
+from itertools import zip_longest
+
+# Marks the end of the shorter iterator in multiset_equal_stream
+_END = object()
+
+
+def multiset_equal(a, b):
+    """
+    Checks whether two sequences contain the same elements with the same number of occurrences.
+
+    Both sequences are counted once in a hash table, O(n) time. NumPy arrays
+    are compared with np.unique instead.
+
+    :param a: Sequence - first sequence of hashable elements
+    :param b: Sequence - second sequence of hashable elements
+    :return: bool - True if both contain the same elements with the same counts, else False
+    """
+    if len(a) != len(b):
+        return False
+    if hasattr(a, "dtype") and hasattr(b, "dtype"):
+        import numpy as np  # only needed for array input
+        values_a, counts_a = np.unique(a, return_counts=True)
+        values_b, counts_b = np.unique(b, return_counts=True)
+        return bool(np.array_equal(values_a, values_b) and np.array_equal(counts_a, counts_b))
+    return Counter(a) == Counter(b)
+
+
+def multiset_equal_stream(iter1, iter2):
+    """
+    Checks whether two iterables contain the same elements with the same counts, in one pass.
+
+    Both iterables are consumed in lockstep while a single table keeps the
+    balance of every element (+1 for iter1, -1 for iter2); elements whose
+    balance is back to 0 are dropped, so memory holds only the unmatched
+    elements. The comparison stops as soon as one iterable ends before the other.
+
+    :param iter1: Iterable - first iterable of hashable elements
+    :param iter2: Iterable - second iterable of hashable elements
+    :return: bool - True if both contain the same elements with the same counts, else False
+    """
+    balance = {}
+    for x, y in zip_longest(iter1, iter2, fillvalue=_END):
+        if x is _END or y is _END:
+            return False
+        if x != y:
+            for item, delta in ((x, 1), (y, -1)):
+                count = balance.get(item, 0) + delta
+                if count:
+                    balance[item] = count
+                else:
+                    del balance[item]
+    return not balance
+
+
+def multiset_diff(a, b):
+    """
+    Reports which elements differ between two order-independent collections.
+
+    :param a: Iterable - first collection of hashable elements
+    :param b: Iterable - second collection of hashable elements
+    :return: tuple(Counter, Counter) - the elements a has more of than b (with the
+             surplus count), and the elements b has more of than a
+    """
+    count_a = Counter(a)
+    count_b = Counter(b)
+    return count_a - count_b, count_b - count_a
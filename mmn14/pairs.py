@@ -0,0 +1,124 @@
+"""
+Pair-difference helpers used by mmn14.find_pairs.
+
+A pair is two positions i, j of a sorted sequence with lst[j] - lst[i] == k
+for a positive k. Equal values (duplicates) at different positions form
+different pairs, so [1, 1, 3] has two pairs with difference 2.
+"""
+
+from collections import Counter
+
+
+def _matching_runs(lst, k):
+    """
+    Finds the runs of equal values whose difference is exactly k in a sorted sequence.
+
+    A two-pointer sweep in O(n) time: j moves forward while the difference is
+    too small, i moves forward while it is too big, and when it matches both
+    pointers skip their whole run of equal values.
+
+    :param lst: Sequence[int] - sorted sequence of integers
+    :param k: int - the positive difference to find
+    :return: generator of (a, b, count of a, count of b) with b - a == k
+    """
+    n = len(lst)
+    i, j = 0, 0
+
+    while j < n:
+        diff = lst[j] - lst[i]
+
+        if diff < k:
+            j += 1
+        elif diff > k:
+            i += 1
+        else:
+            a, b = lst[i], lst[j]
+            i_end, j_end = i + 1, j + 1
+            while i_end < n and lst[i_end] == a:
+                i_end += 1
+            while j_end < n and lst[j_end] == b:
+                j_end += 1
+            yield a, b, i_end - i, j_end - j
+            i, j = i_end, j_end
+
+
+def count_pairs(lst, k):
+    """
+    Counts the pairs (a, b) in a sorted sequence such that b - a == k, duplicates included.
+
+    :param lst: Sequence[int] - sorted sequence of integers (list, array.array or NumPy array)
+    :param k: int - the exact difference to find between values
+    :return: int - number of pairs, 0 if k is not positive
+    """
+    if k <= 0:
+        return 0
+    return sum(count_a * count_b for a, b, count_a, count_b in _matching_runs(lst, k))
+
+
+def iter_pairs(lst, k):
+    """
+    Yields the pairs (a, b) in a sorted sequence such that b - a == k, lazily.
+
+    A value that appears several times yields one pair per occurrence.
+
+    :param lst: Sequence[int] - sorted sequence of integers
+    :param k: int - the exact difference to find between values
+    :return: generator of (a, b) tuples, in increasing order of a
+    """
+    if k <= 0:
+        return
+    for a, b, count_a, count_b in _matching_runs(lst, k):
+        for _ in range(count_a * count_b):
+            yield a, b
+
+
+def count_pairs_many(lst, ks):
+    """
+    Counts the pairs for many differences k at once.
+
+    The values are counted once in a histogram, and every k is then answered
+    from it: the pairs with difference k are count[v] * count[v + k] summed
+    over the distinct values v. NumPy arrays are handled with np.unique and
+    np.searchsorted instead of a dict.
+
+    :param lst: Sequence[int] - sorted sequence of integers (any order for lists)
+    :param ks: Iterable[int] - the differences to count
+    :return: List[int] - the number of pairs for every k, in the same order
+    """
+    ks = list(ks)
+    if hasattr(lst, "dtype"):
+        return _count_pairs_many_np(lst, ks)
+
+    histogram = Counter(lst)
+    result = []
+    for k in ks:
+        if k <= 0:
+            result.append(0)
+        else:
+            result.append(sum(count * histogram.get(v + k, 0) for v, count in histogram.items()))
+    return result
+
+
+def _count_pairs_many_np(arr, ks):
+    """
+    NumPy version of count_pairs_many.
+
+    :param arr: numpy.ndarray - integer array
+    :param ks: List[int] - the differences to count
+    :return: List[int] - the number of pairs for every k, in the same order
+    """
+    import numpy as np  # only needed for array input
+
+    values, counts = np.unique(arr, return_counts=True)
+    counts = counts.astype(np.int64)
+    result = []
+    for k in ks:
+        if k <= 0 or values.size == 0:
+            result.append(0)
+            continue
+        targets = values + k
+        pos = np.searchsorted(values, targets)
+        found = pos < values.size
+        found[found] = values[pos[found]] == targets[found]
+        result.append(int((counts[found] * counts[pos[found]]).sum()))
+    return result
@@ -0,0 +1,205 @@
+"""
+Iterative palindrome checks used by mmn14.is_palindrome and mmn14.string_is_palindrome.
+
+The file functions memory-map their input, so files larger than the available
+memory can be checked without loading them into a Python string.
+"""
+
+import mmap
+import os
+from array import array
+from contextlib import contextmanager
+
+# Number of items compared at a time from each end
+BLOCK_SIZE = 4096
+
+
+def text_is_palindrome(text):
+    """
+    Checks whether a sequence reads the same forwards and backwards.
+
+    Two indexes move from both ends towards the middle. The items are compared
+    in blocks of BLOCK_SIZE, so the work runs at C speed while the extra
+    memory stays O(BLOCK_SIZE) no matter how long the input is, and a mismatch
+    stops the check right away.
+
+    :param text: str, bytes, bytearray, memoryview or list
+    :return: True if text is a palindrome, else False
+    """
+    n = len(text)
+    if n <= BLOCK_SIZE:
+        # short input: a single reversed copy is cheaper than the block loop
+        return text == text[::-1]
+    half = n // 2
+    for lo in range(0, half, BLOCK_SIZE):
+        size = min(BLOCK_SIZE, half - lo)
+        hi = n - lo
+        if text[lo:lo + size] != text[hi - size:hi][::-1]:
+            return False
+    return True
+
+
+def list_is_palindrome(lst):
+    """
+    Checks whether all strings in a list are palindromes and the list itself is a palindrome.
+
+    :param lst: List of strings (or bytes-like objects)
+    :return: True if all strings are palindromes and the list is a palindrome, else False
+    """
+    i, j = 0, len(lst) - 1
+    while i <= j:
+        # lst[i] == lst[j], so checking one of them covers both
+        if lst[i] != lst[j] or not text_is_palindrome(lst[i]):
+            return False
+        i += 1
+        j -= 1
+    return True
+
+
+def palindrome_mask(strings):
+    """
+    Checks a batch of strings.
+
+    :param strings: Iterable of str or bytes-like objects
+    :return: List[bool] - text_is_palindrome for every string, in the same order
+    """
+    return [text_is_palindrome(s) for s in strings]
+
+
+def _radius_typecode(n):
+    """
+    Picks the smallest array typecode that can hold every radius of a text of length n.
+
+    :param n: int - length of the text
+    :return: str - array typecode
+    """
+    for typecode in "BHIQ":
+        if n < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise ValueError("Text is too long!")
+
+
+def longest_palindrome_span(text):
+    """
+    Finds the longest palindromic substring with Manacher's algorithm, in O(n) time.
+
+    For every center, the radius of the longest palindrome around it is
+    computed once for odd lengths and once for even lengths, reusing the
+    radius of its mirror inside the rightmost palindrome found so far.
+
+    The radii take O(n) extra memory: one array of n items at a time, with
+    the smallest item size that fits n (at most 4 bytes per input byte below 4 GiB).
+
+    :param text: str, bytes, memoryview, mmap or any indexable sequence
+    :return: (start, end) - text[start:end] is the first longest palindrome
+    """
+    n = len(text)
+    best_start, best_length = 0, min(n, 1)
+
+    # odd lengths: odd[i] is the radius (center included) of the palindrome centered at i
+    typecode = _radius_typecode(n)
+    odd = array(typecode, [0]) * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and text[i - k] == text[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+        if 2 * k - 1 > best_length:
+            best_start, best_length = i - k + 1, 2 * k - 1
+    del odd
+
+    # even lengths: even[i] is the half-length of the palindrome centered before i
+    even = array(typecode, [0]) * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and text[i - k - 1] == text[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+        if 2 * k > best_length:
+            best_start, best_length = i - k, 2 * k
+
+    return best_start, best_start + best_length
+
+
+def longest_palindromic_substring(text):
+    """
+    Finds the longest palindromic substring, using Manacher's algorithm.
+
+    :param text: str or bytes-like object
+    :return: the first longest palindrome in text, of the same kind as text
+    """
+    start, end = longest_palindrome_span(text)
+    return text[start:end]
+
+
+@contextmanager
+def _mapped(path):
+    """
+    Memory-maps a file read-only and gives access to it as a memoryview.
+
+    :param path: str or path-like - path of the file
+    :return: context manager yielding a memoryview of the file (empty for an empty file)
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield memoryview(b"")  # empty files can't be memory-mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                yield view
+
+
+def file_is_palindrome(path):
+    """
+    Checks whether the contents of a file read the same forwards and backwards.
+
+    :param path: str or path-like - path of the file
+    :return: True if the bytes of the file are a palindrome, else False
+    """
+    with _mapped(path) as view:
+        return text_is_palindrome(view)
+
+
+def file_records_are_palindromes(path, separator=b"\n"):
+    """
+    Checks every record (line by default) of a file, lazily.
+
+    The records are located with mmap.find and compared in place, without
+    copying them; a trailing separator does not create an empty record.
+
+    :param path: str or path-like - path of the file
+    :param separator: bytes - the record separator
+    :return: generator of bool - whether each record is a palindrome, in file order
+    :raises ValueError: if separator is empty
+    """
+    if not separator:
+        raise ValueError("Empty separator!")
+    with _mapped(path) as view:
+        data = view.obj  # the mmap itself, for its fast find()
+        start = 0
+        n = len(view)
+        while start < n:
+            end = data.find(separator, start)
+            if end == -1:
+                end = n
+            with view[start:end] as record:
+                result = text_is_palindrome(record)
+            yield result
+            start = end + len(separator)
+
+
+def file_longest_palindrome(path):
+    """
+    Finds the longest palindrome in a file, using Manacher's algorithm on the mapped bytes.
+
+    :param path: str or path-like - path of the file
+    :return: (start, end) - byte offsets of the first longest palindrome in the file
+    """
+    with _mapped(path) as view:
+        return longest_palindrome_span(view)
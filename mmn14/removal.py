@@ -0,0 +1,120 @@
+"""
+Removal helpers used by mmn14.update_list.
+
+All functions work on lists and array.array, and on NumPy arrays when a new
+array is returned (NumPy arrays can't shrink in place).
+"""
+
+from array import array
+from collections import Counter
+
+
+def _is_numpy(seq):
+    """
+    Checks whether a sequence is a NumPy array.
+
+    :param seq: the sequence to check
+    :return: bool - True for NumPy arrays, else False
+    """
+    return hasattr(seq, "dtype") and hasattr(seq, "shape")
+
+
+def _check_in_place(seq):
+    """
+    Validates that a sequence can shrink in place.
+
+    :param seq: the sequence to check
+    :raises TypeError: if seq is a NumPy array
+    """
+    if _is_numpy(seq):
+        raise TypeError("NumPy arrays can't be changed in place!")
+
+
+def find_first(seq, value, start=0):
+    """
+    Finds the index of the first occurrence of value at or after start, without recursion.
+
+    :param seq: Sequence - list, array.array or NumPy array
+    :param value: the value to look for
+    :param start: int - index to start looking from
+    :return: int - the index of value, or -1 if it is not found
+    """
+    if _is_numpy(seq):
+        found = (seq[start:] == value).nonzero()[0]
+        return start + int(found[0]) if len(found) else -1
+    try:
+        return seq.index(value, start)
+    except ValueError:
+        return -1
+
+
+def remove_first(seq, value, start=0, in_place=False):
+    """
+    Removes the first occurrence of value at or after start.
+
+    :param seq: Sequence - list, array.array or NumPy array
+    :param value: the value to remove (first occurrence only)
+    :param start: int - index to start looking from
+    :param in_place: bool - delete from seq itself instead of building a new sequence
+    :return: the sequence without the value; seq itself if the value is not found or in_place is set
+    :raises TypeError: if in_place is set for a NumPy array
+    """
+    if in_place:
+        _check_in_place(seq)
+
+    i = find_first(seq, value, start)
+    if i == -1:
+        return seq
+    if in_place:
+        del seq[i]
+        return seq
+    if _is_numpy(seq):
+        import numpy as np  # only needed for array input
+        return np.delete(seq, i)
+    return seq[:i] + seq[i + 1:]
+
+
+def remove_many(seq, values, in_place=False):
+    """
+    Removes the first occurrence of every value in values, in a single pass.
+
+    The values to remove are kept in a map from value to the number of
+    occurrences still to remove, so every item of seq is checked once,
+    O(n + m) in total. A value listed twice removes its first two occurrences.
+
+    :param seq: Sequence - list, array.array or NumPy array
+    :param values: Iterable - the values to remove
+    :param in_place: bool - compact seq itself instead of building a new sequence
+    :return: the sequence without the removed values (seq itself if in_place is set)
+    :raises TypeError: if in_place is set for a NumPy array
+    """
+    if in_place:
+        _check_in_place(seq)
+
+    pending = Counter(values)
+    items = seq.tolist() if _is_numpy(seq) else seq
+    keep = []
+    for item in items:
+        if pending.get(item):
+            pending[item] -= 1
+            keep.append(False)
+        else:
+            keep.append(True)
+
+    if _is_numpy(seq):
+        return seq[keep]
+
+    if in_place:
+        # move the kept items to the front, then cut the tail
+        write = 0
+        for read, kept in enumerate(keep):
+            if kept:
+                seq[write] = seq[read]
+                write += 1
+        del seq[write:]
+        return seq
+
+    kept_items = [item for item, kept in zip(seq, keep) if kept]
+    if isinstance(seq, array):
+        return array(seq.typecode, kept_items)
+    return kept_items
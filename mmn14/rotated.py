@@ -0,0 +1,199 @@
+"""
+Binary search helpers for rotated sorted sequences, used by mmn14.find_max.
+
+A rotated sorted sequence is an increasing sequence of unique values that was
+rotated at some unknown pivot, for example [5, 6, 7, 1, 2, 3, 4]. All the
+functions work on any indexable sequence: lists, array.array and NumPy arrays.
+"""
+
+
+def rotation_pivot(seq):
+    """
+    Finds the index of the smallest value of a rotated sorted sequence in O(log n) time.
+
+    The search is iterative: while the middle value is larger than the last
+    value of the range, the pivot must be to the right of the middle,
+    otherwise it is the middle or to its left.
+
+    :param seq: Sequence[int] - a rotated sorted sequence of unique values
+    :return: int - index of the smallest value (0 if the sequence is not rotated or empty)
+    """
+    lo, hi = 0, len(seq) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if seq[mid] > seq[hi]:
+            lo = mid + 1
+        else:
+            hi = mid
+    return max(lo, 0)
+
+
+def find_max(seq, pivot=None):
+    """
+    Finds the maximum value of a rotated sorted sequence in O(log n) time.
+
+    :param seq: Sequence[int] - a rotated sorted sequence of unique values
+    :param pivot: int or None - a pivot already returned by rotation_pivot, to skip the search
+    :return: the maximum value, or None if the sequence is empty
+    """
+    if len(seq) == 0:
+        return None
+    if pivot is None:
+        pivot = rotation_pivot(seq)
+    return seq[pivot - 1]
+
+
+def find_min(seq, pivot=None):
+    """
+    Finds the minimum value of a rotated sorted sequence in O(log n) time.
+
+    :param seq: Sequence[int] - a rotated sorted sequence of unique values
+    :param pivot: int or None - a pivot already returned by rotation_pivot, to skip the search
+    :return: the minimum value, or None if the sequence is empty
+    """
+    if len(seq) == 0:
+        return None
+    if pivot is None:
+        pivot = rotation_pivot(seq)
+    return seq[pivot]
+
+
+def bisect_rotated(seq, x, pivot=None):
+    """
+    Finds the rank of x in a rotated sorted sequence in O(log n) time.
+
+    This is bisect_left on the sorted order of the sequence: positions are
+    counted from the pivot, so position k is seq[(pivot + k) % n].
+
+    :param seq: Sequence[int] - a rotated sorted sequence of unique values
+    :param x: the value to look for
+    :param pivot: int or None - a pivot already returned by rotation_pivot, to skip the search
+    :return: int - number of values in seq smaller than x
+    """
+    n = len(seq)
+    if pivot is None:
+        pivot = rotation_pivot(seq)
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if seq[(pivot + mid) % n] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def search_rotated(seq, x, pivot=None):
+    """
+    Finds the index of x in a rotated sorted sequence in O(log n) time.
+
+    :param seq: Sequence[int] - a rotated sorted sequence of unique values
+    :param x: the value to look for
+    :param pivot: int or None - a pivot already returned by rotation_pivot, to skip the search
+    :return: int - the index of x in seq, or -1 if x is not in seq
+    """
+    n = len(seq)
+    if n == 0:
+        return -1
+    if pivot is None:
+        pivot = rotation_pivot(seq)
+    rank = bisect_rotated(seq, x, pivot)
+    if rank < n and seq[(pivot + rank) % n] == x:
+        return (pivot + rank) % n
+    return -1
+
+
+class RotatedSortedIndex:
+    """
+    Answers repeated queries against the same rotated sorted sequence.
+
+    The pivot is searched once, on the first query, and cached. When the
+    underlying buffer changes, call invalidate() (or notify_rotation() when
+    the amount of the rotation is known) so the next query uses a valid pivot.
+    """
+
+    def __init__(self, seq):
+        """
+        Initialize an index over a rotated sorted sequence.
+
+        :param seq: Sequence[int] - a rotated sorted sequence of unique values (not copied)
+        """
+        self._seq = seq
+        self._pivot = None
+
+    def get_pivot(self):
+        """
+        Get the index of the smallest value, searching for it only if it isn't cached.
+
+        :return: int - the pivot index
+        """
+        if self._pivot is None:
+            self._pivot = rotation_pivot(self._seq)
+        return self._pivot
+
+    def invalidate(self):
+        """
+        Forget the cached pivot, after the sequence was changed in an unknown way.
+        """
+        self._pivot = None
+
+    def notify_rotation(self, k):
+        """
+        Update the cached pivot after the sequence was rotated k positions to the right.
+
+        :param k: int - the right rotation applied to the sequence (negative for left)
+        """
+        if self._pivot is not None and len(self._seq):
+            self._pivot = (self._pivot + k) % len(self._seq)
+
+    def __len__(self):
+        return len(self._seq)
+
+    def __contains__(self, x):
+        return self.index_of(x) != -1
+
+    def get_min(self):
+        """
+        Get the minimum value.
+
+        :return: the minimum value, or None if the sequence is empty
+        """
+        return find_min(self._seq, self.get_pivot())
+
+    def get_max(self):
+        """
+        Get the maximum value.
+
+        :return: the maximum value, or None if the sequence is empty
+        """
+        return find_max(self._seq, self.get_pivot())
+
+    def index_of(self, x):
+        """
+        Find the index of a value.
+
+        :param x: the value to look for
+        :return: int - the index of x in the sequence, or -1 if x is not in it
+        """
+        return search_rotated(self._seq, x, self.get_pivot())
+
+    def rank(self, x):
+        """
+        Count the values smaller than x.
+
+        :param x: the value to compare to
+        :return: int - the number of values smaller than x
+        """
+        return bisect_rotated(self._seq, x, self.get_pivot())
+
+    def count_range(self, lo, hi):
+        """
+        Count the values v such that lo <= v < hi.
+
+        :param lo: inclusive lower bound
+        :param hi: exclusive upper bound
+        :return: int - the number of values in the range
+        """
+        if hi <= lo:
+            return 0
+        return self.rank(hi) - self.rank(lo)
@@ -0,0 +1,241 @@
+"""
+Test module for the mmn14 functions and their helper modules.
+"""
+
+from array import array
+
+import pytest
+
+from mmn14 import find_max, find_pairs, equal_lists, update_list, update_list_helper
+from mmn14 import is_palindrome, string_is_palindrome
+from rotated import find_min, search_rotated, rotation_pivot, RotatedSortedIndex
+from pairs import iter_pairs, count_pairs_many
+from multiset import multiset_equal_stream, multiset_diff
+from removal import remove_many
+from palindromes import palindrome_mask, longest_palindromic_substring
+from palindromes import file_is_palindrome, file_records_are_palindromes
+import palindromes
+import bench_mmn14
+
+
+def _rotations(values):
+    return [values[-k:] + values[:-k] if k else list(values) for k in range(len(values))]
+
+
+def test_find_max():
+    assert find_max([17, 40, 42, 2, 6, 11]) == 42
+    assert find_max([5, 6, 7, 1, 2, 3, 4]) == 7
+    assert find_max([2, 3, 4, 5, 6]) == 6
+    assert find_max([]) == "None"
+    for lst in _rotations([1, 4, 9, 16, 25, 36, 49]):
+        assert find_max(lst) == 49 and find_min(lst) == 1
+        assert lst[rotation_pivot(lst)] == 1
+    assert find_max(array("i", [3, 4, 1, 2])) == 4
+
+
+def test_search_rotated():
+    values = [-7, -3, 0, 1, 3, 5, 12]
+    for lst in _rotations(values):
+        pivot = rotation_pivot(lst)
+        for x in values:
+            assert search_rotated(lst, x) == search_rotated(lst, x, pivot) == lst.index(x)
+        for x in (-10, 2, 4, 100):
+            assert search_rotated(lst, x, pivot) == -1, f"{x} should not be found in {lst}"
+    assert search_rotated([], 3) == -1
+    assert find_min([]) is None
+
+
+def test_rotated_np():
+    np = pytest.importorskip("numpy")
+    arr = np.array([30, 40, 50, 10, 20])
+    assert find_max(arr) == 50 and find_min(arr) == 10
+    assert rotation_pivot(arr) == 3 and search_rotated(arr, 20) == 4
+
+
+def test_rotated_sorted_index():
+    buffer = [12, 15, 20, 1, 4, 9]
+    index = RotatedSortedIndex(buffer)
+    assert index.get_max() == 20 and index.get_min() == 1 and index.get_pivot() == 3
+    assert 9 in index and 10 not in index and index.index_of(15) == 1
+    assert index.rank(10) == 3 and index.rank(0) == 0 and index.rank(100) == 6
+    assert index.count_range(4, 15) == 3 and index.count_range(15, 4) == 0
+
+    buffer[:] = buffer[-2:] + buffer[:-2]
+    index.notify_rotation(2)
+    assert index.get_pivot() == rotation_pivot(buffer) and index.index_of(15) == 3
+
+    buffer[:] = [7, 8, 2, 3]
+    index.invalidate()
+    assert index.get_max() == 8 and len(index) == 4
+    assert RotatedSortedIndex([]).get_max() is None
+
+
+def _naive_pairs(lst, k):
+    return [(lst[i], lst[j]) for i in range(len(lst)) for j in range(len(lst))
+            if lst[j] - lst[i] == k and lst[i] < lst[j]]
+
+
+def test_find_pairs():
+    lst = [-7, -3, 0, 1, 3, 5, 12, 14, 17, 19, 25, 30]
+    assert find_pairs(lst, 2) == 4 and find_pairs(lst, 6) == 2 and find_pairs(lst, 23) == 0
+    assert find_pairs([1, 3, 5, 7, 9, 11], 2) == 5
+    dup = [1, 1, 2, 3, 3, 3, 5, 5]
+    for k in range(-1, 6):
+        expected = _naive_pairs(dup, k)
+        assert find_pairs(dup, k) == len(expected), f"find_pairs with k={k} is wrong"
+        assert sorted(iter_pairs(dup, k)) == sorted(expected)
+    assert count_pairs_many(dup, range(-1, 6)) == [len(_naive_pairs(dup, k)) for k in range(-1, 6)]
+    assert find_pairs([], 1) == 0 and list(iter_pairs([4], 1)) == []
+
+
+def test_count_pairs_many_np():
+    np = pytest.importorskip("numpy")
+    arr = np.array([1, 1, 2, 3, 3, 3, 5, 5])
+    ks = [0, 1, 2, 3, 4, 10]
+    assert count_pairs_many(arr, ks) == count_pairs_many(arr.tolist(), ks)
+    assert find_pairs(arr, 2) == 12
+
+
+def test_equal_lists():
+    assert equal_lists([1, 4, 3, 1, 2], [1, 1, 2, 3, 4])
+    assert not equal_lists([8, 1, 3, 3], [8, 1, 3])
+    assert equal_lists([2, 2, 2], [2, 2, 2]) and equal_lists([], [])
+    assert not equal_lists([1, 2, 3], [3, 2, 2])
+    big = list(range(100000))
+    assert equal_lists(big, big[::-1]), "Long lists should not hit the recursion limit"
+
+
+def test_multiset_stream_and_diff():
+    assert multiset_equal_stream(iter([1, 2, 2, 3]), iter([2, 3, 1, 2]))
+    assert not multiset_equal_stream([1, 2], [1, 2, 2])
+    assert not multiset_equal_stream([1, 2, 3], [3, 2, 2])
+    assert multiset_equal_stream([], [])
+    only_a, only_b = multiset_diff([1, 2, 2, 5], [2, 5, 5, 7])
+    assert only_a == {1: 1, 2: 1} and only_b == {5: 1, 7: 1}
+
+
+def test_equal_lists_np():
+    np = pytest.importorskip("numpy")
+    assert equal_lists(np.array([3, 1, 2, 1]), np.array([1, 1, 2, 3]))
+    assert not equal_lists(np.array([3, 1, 2, 2]), np.array([1, 1, 2, 3]))
+
+
+def test_update_list():
+    lst = [3, 1, 8, 10, 6]
+    assert update_list(lst, 1) == [3, 8, 10, 6] and lst == [3, 1, 8, 10, 6]
+    assert update_list([4, 3, 1, 3], 3) == [4, 1, 3]
+    assert update_list(lst, 2) is lst, "A missing value returns the list unchanged"
+    assert update_list([], 5) == []
+    assert update_list_helper([3, 1, 3, 1], 3, 1) == [3, 1, 1], "The search starts at index i"
+    assert update_list(lst, 8, in_place=True) is lst and lst == [3, 1, 10, 6]
+    big = list(range(100000))
+    assert update_list(big, 99999) == big[:-1], "Long lists should not hit the recursion limit"
+    assert update_list(array("i", [5, 6, 5]), 5) == array("i", [6, 5])
+
+
+def test_remove_many():
+    assert remove_many([4, 1, 4, 2, 4, 3], [4, 4, 3, 9]) == [1, 2, 4]
+    arr = array("i", [4, 1, 4, 2])
+    assert remove_many(arr, [4, 2]) == array("i", [1, 4])
+    lst = [4, 1, 4, 2, 4, 3]
+    assert remove_many(lst, [4, 3], in_place=True) is lst and lst == [1, 4, 2, 4]
+    assert remove_many([], [1]) == []
+
+
+def test_removal_np():
+    np = pytest.importorskip("numpy")
+    arr = np.array([3, 1, 3, 2])
+    assert update_list(arr, 3).tolist() == [1, 3, 2]
+    assert update_list_helper(arr, 3, 1).tolist() == [3, 1, 2]
+    assert update_list(arr, 7) is arr
+    assert remove_many(arr, [3, 2]).tolist() == [1, 3]
+    with pytest.raises(TypeError):
+        update_list(arr, 3, in_place=True)
+
+
+def test_palindromes():
+    assert is_palindrome(["abba", "xyx", "abba"]) and is_palindrome([]) and is_palindrome(["a"])
+    assert not is_palindrome(["abba", "xyz", "abba"]), "Every string must be a palindrome"
+    assert not is_palindrome(["aba", "cc", "bab"]), "The list must be a palindrome"
+    assert not is_palindrome(["ab"])
+    for text in ("", "a", "abcba", "abccba", "ab", "abca"):
+        expected = text == text[::-1]
+        assert string_is_palindrome(text) == expected, f"string_is_palindrome({text!r}) is wrong"
+        assert string_is_palindrome(text.encode()) == expected
+        assert string_is_palindrome(memoryview(text.encode())) == expected
+    assert palindrome_mask(["noon", "moon", b"wow", ""]) == [True, False, True, True]
+
+
+def test_palindromes_long(monkeypatch):
+    monkeypatch.setattr(palindromes, "BLOCK_SIZE", 7)
+    text = "".join(chr(97 + i % 26) for i in range(1001))
+    long_palindrome = text + text[::-1]
+    assert string_is_palindrome(long_palindrome) and string_is_palindrome(long_palindrome[1:-1])
+    broken = long_palindrome[:1500] + "!" + long_palindrome[1501:]
+    assert not string_is_palindrome(broken)
+    assert is_palindrome(["aba"] * 100000), "Long lists should not hit the recursion limit"
+
+
+def _naive_longest(text):
+    best = text[:0]
+    for i in range(len(text)):
+        for j in range(i + len(best) + 1, len(text) + 1):
+            if text[i:j] == text[i:j][::-1]:
+                best = text[i:j]
+    return best
+
+
+def test_longest_palindromic_substring():
+    for text in ("", "a", "ab", "aa", "babad", "cbbd", "forgeeksskeegfor", "abacdfgdcaba", "aaaabaaa"):
+        assert longest_palindromic_substring(text) == _naive_longest(text), f"Wrong answer for {text!r}"
+    assert longest_palindromic_substring(b"xyzracecarxy") == b"racecar"
+    text = b"x" + b"ab" * 40000 + b"a"
+    assert palindromes.longest_palindrome_span(text) == (1, len(text)), "Radii above 255 must fit"
+    assert [palindromes._radius_typecode(n) for n in (0, 255, 256, 70000)] == ["B", "B", "H", "I"]
+
+
+def test_palindrome_files(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_bytes(b"level\nnope\n\nabba\nxyzzyx")
+    assert list(file_records_are_palindromes(path)) == [True, False, True, True, True]
+    assert not file_is_palindrome(path)
+    assert palindromes.file_longest_palindrome(path) == (11, 17), "The first of the longest palindromes"
+
+    path.write_bytes(b"ab\nba")
+    assert file_is_palindrome(path)
+    assert list(file_records_are_palindromes(path, separator=b"\n")) == [False, False]
+    with pytest.raises(ValueError):
+        list(file_records_are_palindromes(path, separator=b""))
+
+    path.write_bytes(b"")
+    assert file_is_palindrome(path) and list(file_records_are_palindromes(path)) == []
+    assert palindromes.file_longest_palindrome(path) == (0, 0)
+
+
+def test_benchmarks(capsys):
+    results = bench_mmn14.run_benchmarks(sizes=[40, 200, 4000], repeat=1)
+    assert set(results) == set(bench_mmn14.BENCHMARKS)
+    for name, rows in results.items():
+        current = [rows[size]["current"]["stack"] for size in ("40", "200", "4000")]
+        assert len(set(current)) == 1, f"{name} should use the same stack depth for every size"
+        assert rows["4000"]["current"]["per_element"] > 0
+    for name in ("update_list", "equal_lists", "is_palindrome", "string_is_palindrome"):
+        assert results[name]["200"]["recursive"]["stack"] > results[name]["40"]["recursive"]["stack"]
+        assert results[name]["4000"]["recursive"]["stack"] is None, f"{name} should exceed the recursion limit"
+
+    assert bench_mmn14.main(["--sizes", "10", "--repeat", "1", "--only", "find_max"]) == 0
+    assert "find_max" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    test_find_max()
+    test_search_rotated()
+    test_rotated_sorted_index()
+    test_find_pairs()
+    test_equal_lists()
+    test_multiset_stream_and_diff()
+    test_update_list()
+    test_remove_many()
+    test_palindromes()
+    test_longest_palindromic_substring()
+    print("All mmn14 tests passed!")